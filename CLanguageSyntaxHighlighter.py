@@ -1,201 +1,357 @@
+import itertools
+import os
+
 from PyQt5.QtGui import (
-    QTextCursor,
     QTextCharFormat,
     QFont,
     QColor,
     QSyntaxHighlighter
 )
-from PyQt5.QtWidgets import QMainWindow, QTextEdit
-from PyQt5.QtCore import QRegularExpression
+from PyQt5.QtWidgets import QMainWindow, QFileDialog, QListWidgetItem
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 
 from uygulama_arayuz import Ui_MainWindow
-from parseTree import tokenize, Parser, Token
+from parseTree import tokenize_line, STATE_NORMAL, TOKEN_STYLES
+from workspace import Workspace, AnalysisResult
+from code_editor import CodeEditor, BlockData
+from snapshot import content_key, load_snapshot, write_snapshot
 
 
 class CSyntaxHighlighter(QSyntaxHighlighter):
     """
     C dili için gerçek zamanlı sözdizimi vurgulayıcı (QSyntaxHighlighter tabanlı).
-    Aşağıdaki token tiplerini renklendirir:
+    Her satır parseTree.tokenize_line() ile lex’lenir ve token tipine göre renklendirilir.
+    Aşağıdaki token tiplerini renklendirir (stiller parseTree.TOKEN_SPECIFICATION’dan gelir):
       1. Identifiers (değişken/fonksiyon/ad) → koyu siyah
-      2. Anahtar sözcükler (int, char, void, if, else, while, for, return, struct, union, typedef) → kırmızı/bold
-      3. Preprocessor direktifleri (#include, #define vb.) → koyu mavi
+      2. C11 anahtar sözcükleri (int, unsigned, const, static, switch, sizeof, enum, …) → kırmızı/bold
+      3. Preprocessor direktifleri (#include, #define, %:include vb., “\” ile devam eden satırlar dahil) → koyu mavi
       4. Tek satırlık yorum (//…) → koyu yeşil italik
       5. Çok satırlı yorum (/*…*/) → koyu yeşil italik
-      6. String literal → magenta
+      6. String literal (u8/u/U/L önekleri dahil) → magenta
       7. Char literal → magenta
-      8. Ondalık sayılar (integer + float) → mavi
-      9. Onaltılık sayılar (0x…) → mavi
-     10. Operatörler (==, !=, <=, >=, ++, --, +=, -=, &&, ||, <<, >>, ->, +, -, *, /, %, <, >, &, ^, |, =, ~, !, ?, :) → koyu turuncu
-     11. Ayraçlar (; , ( ) { } [ ]) → koyu turuncu
+      8. Ondalık sayılar (10UL, 1.5, .5f, 1e-3L) → mavi
+      9. Onaltılık sayılar (0x1F, 0x1.8p3) → mavi
+     10. Operatörler (..., <<=, >>=, %=, &=, |=, ^=, ->, ==, ++, ., ?:, %:%:, …) → koyu turuncu
+     11. Ayraçlar (; , ( ) { } [ ] ve <: :> <% %>) → koyu turuncu
     """
 
     def __init__(self, document):
         super().__init__(document)
-        self.rules = []
-
-        # 1) Identifiers → koyu siyah (en başta, böylece keyword’leri override etmeden önce tüm kelimeler siyaha boyanır)
-        id_fmt = QTextCharFormat()
-        id_fmt.setForeground(QColor("black"))
-        pattern_id = QRegularExpression(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
-        self.rules.append((pattern_id, id_fmt))
-
-        # 2) Anahtar sözcükler → kırmızı, bold (identifier’dan sonra gelir, böylece int/char gibi önceden siyah olan kelimeler kırmızıya dönüşür)
-        kw_fmt = QTextCharFormat()
-        kw_fmt.setForeground(QColor("red"))
-        kw_fmt.setFontWeight(QFont.Bold)
-        kws = ["int", "char", "void", "if", "else", "while", "for", "return", "struct", "union", "typedef"]
-        pattern_kw = QRegularExpression(r"\b(" + "|".join(kws) + r")\b")
-        self.rules.append((pattern_kw, kw_fmt))
-
-        # 3) Preprocessor direktifleri → koyu mavi
-        pp_fmt = QTextCharFormat()
-        pp_fmt.setForeground(QColor("#000080"))
-        # ^\s*#.*$ → satır başından başlayıp, boşluk + # + kalan tüm metin
-        pp_pattern = QRegularExpression(r"^\s*#.*$", QRegularExpression.MultilineOption)
-        self.rules.append((pp_pattern, pp_fmt))
-
-        # 4) Tek satırlık yorum (//…) → koyu yeşil italik
-        comment1_fmt = QTextCharFormat()
-        comment1_fmt.setForeground(QColor("#006400"))
-        comment1_fmt.setFontItalic(True)
-        # // ile satır sonuna kadar her şeyi yakalar
-        pattern1 = QRegularExpression(r"//[^\n]*")
-        self.rules.append((pattern1, comment1_fmt))
-
-        # 5) Çok satırlı yorum (/*…*/) — highlightBlock içinde işlenecek
-        self.comment2_fmt = QTextCharFormat()
-        self.comment2_fmt.setForeground(QColor("#006400"))
-        self.comment2_fmt.setFontItalic(True)
-        # Yalnızca başlangıç ve bitiş desenleri regex olarak saklanır; highlightBlock’ta aralık bulunur.
-        self.comment2_start = QRegularExpression(r"/\*")
-        self.comment2_end = QRegularExpression(r"\*/")
-
-        # 6) String literal → magenta
-        string_fmt = QTextCharFormat()
-        string_fmt.setForeground(QColor("magenta"))
-        # "(?:\\.|[^"\\])*" → escape karakteriyle başlayan veya normal karakter
-        pattern_str = QRegularExpression(r"\"(?:\\.|[^\"\\])*\"")
-        self.rules.append((pattern_str, string_fmt))
-
-        # 7) Char literal → magenta
-        char_fmt = QTextCharFormat()
-        char_fmt.setForeground(QColor("magenta"))
-        # '(?:\\.|[^'\\])*' → escape veya normal karakter
-        pattern_ch = QRegularExpression(r"'(?:\\.|[^'\\])*'")
-        self.rules.append((pattern_ch, char_fmt))
-
-        # 8) Ondalık sayılar (integer + float) → mavi
-        num_fmt = QTextCharFormat()
-        num_fmt.setForeground(QColor("blue"))
-        # \b[0-9]+(?:\.[0-9]*)?(?:[eE][+-]?[0-9]+)?\b
-        pattern_num = QRegularExpression(r"\b[0-9]+(?:\.[0-9]*)?(?:[eE][+-]?[0-9]+)?\b")
-        self.rules.append((pattern_num, num_fmt))
-
-        # 9) Onaltılık sayılar (0x…) → mavi
-        hex_fmt = QTextCharFormat()
-        hex_fmt.setForeground(QColor("blue"))
-        pattern_hex = QRegularExpression(r"\b0[xX][0-9A-Fa-f]+\b")
-        self.rules.append((pattern_hex, hex_fmt))
-
-        # 10) Operatörler → koyu turuncu
-        op_fmt = QTextCharFormat()
-        op_fmt.setForeground(QColor("#8B4500"))
-        # Çok karakterli operatörler öncelikli, sonra tek karakterli
-        ops = [
-            r"==", r"!=", r"<=", r">=", r"\+\+", r"--", r"\+=", r"-=", r"\*=", r"/=", r"&&", r"\|\|",
-            r"<<", r">>", r"->",            # Çok karakterli operatörler
-            r"[+\-*/%<>&\^|=~!?:]"          # Tek karakterli operatörler ve ?:
-        ]
-        pattern_op = QRegularExpression("(" + "|".join(ops) + ")")
-        self.rules.append((pattern_op, op_fmt))
-
-        # 11) Ayraçlar (; , ( ) { } [ ]) → koyu turuncu
-        sep_fmt = QTextCharFormat()
-        sep_fmt.setForeground(QColor("#8B4500"))
-        pattern_sep = QRegularExpression(r"[;,()\[\]\{\}]")
-        self.rules.append((pattern_sep, sep_fmt))
+        # Token tipi → biçim. Renkler parseTree.TOKEN_SPECIFICATION tablosunun stil sütunundan
+        # (TOKEN_STYLES) okunur; satırlar regex ile değil, parser ile aynı lexer’la
+        # (tokenize_line) taranır ve her token kendi tipinin biçimiyle boyanır.
+        self.formats = {}
+        for kind, (color, bold, italic) in TOKEN_STYLES.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            if bold:
+                fmt.setFontWeight(QFont.Bold)
+            if italic:
+                fmt.setFontItalic(True)
+            self.formats[kind] = fmt
+
+        # Düzenleme başına sayaçlar:
+        #   - last_edit_blocks: Son düzenlemede highlightBlock’un çağrıldığı blok sayısı.
+        #   - last_edit_lexed:  Bunlardan gerçekten yeniden lex’lenenler (metni veya başlangıç
+        #                       durumu değişmiş bloklar).
+        #   - total_lexed:      Vurgulayıcı oluşturulduğundan beri lex’lenen blok sayısı.
+        self.last_edit_blocks = 0
+        self.last_edit_lexed = 0
+        self.total_lexed = 0
+        self._blocks = 0
+        self._lexed = 0
+        # Metin yüklenirken (CodeEditor.restore) satırların token’ları lex’lenmek yerine
+        # buradan okunur; yükleme bitince None yapılır.
+        self.snapshot = None
+        # Qt, belgeye bağlanırken contentsChange’e kendi yeniden vurgulama slotunu bağlar.
+        # Bir düzenlemenin başını ve sonunu yakalamak için belge ayrılıp yeniden bağlanır;
+        # sinyal geldiğinde sırasıyla _on_edit_start, Qt’nin slotu ve _on_edit_end çalışır.
+        self.setDocument(None)
+        document.contentsChange.connect(self._on_edit_start)
+        self.setDocument(document)
+        document.contentsChange.connect(self._on_edit_end)
+
+    def _on_edit_start(self, position: int, removed: int, added: int):
+        self._blocks = 0
+        self._lexed = 0
+
+    def _on_edit_end(self, position: int, removed: int, added: int):
+        self.last_edit_blocks = self._blocks
+        self.last_edit_lexed = self._lexed
 
     def highlightBlock(self, text: str):
         """
-        Her satır için çağrılır. Önce self.rules içindeki regex+format çiftlerini uygular,
-        ardında çok satırlı yorum (/* ... */) bloklarını işleyecek ek mantığı çalıştırır.
-        """
-        # 1) Listedeki her bir (regex, format) çifti için globalMatch ile satırı tarar
-        for regex, fmt in self.rules:
-            it = regex.globalMatch(text)
-            while it.hasNext():
-                match = it.next()
-                start = match.capturedStart()    # Eşleşmenin başladığı indeks
-                length = match.capturedLength()  # Eşleşmenin uzunluğu
-                self.setFormat(start, length, fmt)
-
-        # 2) Çok satırlı yorum /*******/ bloklarını işle
-        #    Önce bu satırın bir önceki blokta yorum içinde kalıp kalmadığını kontrol et
-        self.setCurrentBlockState(0)
-        start_idx = 0
-        if self.previousBlockState() != 1:
-            # Önceki blok yorum içinde değilse, bu satırda yeni bir /* açılışı ara
-            match_start = self.comment2_start.match(text)
-            start_idx = match_start.capturedStart() if match_start.hasMatch() else -1
+        Her satır için çağrılır. Satır, önceki bloğun durumundan (yorum içinde mi?) başlanarak
+        tokenize_line() ile lex’lenir; her token tipinin biçimi uygulanır. Token listesi
+        BlockData olarak bloğa yazılır, böylece parser ve satır numarası alanı aynı satırı
+        tekrar lex’lemez.
+        Qt, bloğun satır sonu durumu (setCurrentBlockState) eskisiyle aynı kaldığı anda
+        sonraki blokları vurgulamayı bırakır. Metni ve başlangıç durumu değişmemiş bir blok
+        yeniden vurgulanırsa (katlama, biçim değişikliği) önbellekteki token’lar kullanılır.
+        Bir anlık görüntüden yüklenirken satırın token’ları, başlangıç durumu tutuyorsa
+        lex’lenmeden anlık görüntüden alınır.
+        """
+        self._blocks += 1
+        state = self.previousBlockState()
+        if state < 0:
+            # -1: önceki blok yok veya henüz vurgulanmadı
+            state = STATE_NORMAL
+        text_hash = hash(text)
+        old = self.currentBlockUserData()
+        if isinstance(old, BlockData) and old.start_state == state and old.text_hash == text_hash:
+            data = old
+            if data.tokens is None:
+                # Token’lar bellek bütçesi nedeniyle bırakılmıştı (CodeEditor.release_token_caches)
+                data.tokens_for(text)
+                self._lexed += 1
+                self.total_lexed += 1
         else:
-            # Önceki blok hâlâ yorum içindeydi, satır başından ara
-            start_idx = 0
-
-        # Yorum başlangıcından itibaren döngüyle bitişi bulmaya çalış
-        while start_idx >= 0:
-            match_end = self.comment2_end.match(text, start_idx)
-            if match_end.hasMatch():
-                # Bitiş bulunduysa, aralığı renklendir
-                end = match_end.capturedEnd()
-                length = end - start_idx
-                self.setFormat(start_idx, length, self.comment2_fmt)
-                # Satır içinde başka /* var mı kontrol et
-                match_start = self.comment2_start.match(text, end)
-                start_idx = match_start.capturedStart() if match_start.hasMatch() else -1
-            else:
-                # Bitiş bulunmadıysa, satır boyunca renklendir ve bir sonraki satırda devam et
-                length = len(text) - start_idx
-                self.setFormat(start_idx, length, self.comment2_fmt)
-                self.setCurrentBlockState(1)  # Bir sonraki satır da yorum içinde başlasın
-                break
+            cached = None
+            if self.snapshot is not None:
+                cached = self.snapshot.line(self.currentBlock().blockNumber(), text, state)
+            if cached is None:
+                cached = tokenize_line(text, state)
+                self._lexed += 1
+                self.total_lexed += 1
+            tokens, end_state = cached
+            data = BlockData(tokens, state, end_state, text_hash)
+            # Katlama durumu satırın içeriğinden bağımsızdır; yeniden lex’lemede korunur
+            if isinstance(old, BlockData):
+                data.folded = old.folded
+
+        for tok in data.tokens:
+            fmt = self.formats.get(tok.type)
+            if fmt is not None:
+                self.setFormat(tok.position, len(tok.value), fmt)
+
+        if data is not old:
+            self.setCurrentBlockUserData(data)
+        # STATE_COMMENT ise bir sonraki satır da yorum içinde başlar
+        self.setCurrentBlockState(data.state)
 
 
 class Highlighter(QMainWindow):
     """
     Ana uygulama penceresi. UI tanımı uygulama_arayuz.py içinde,
     bu sınıfta şöyle işler gerçekleşir:
-      - CSyntaxHighlighter, textEdit’in document’ına bağlanır → anlık vurgulama.
-      - textEdit.textChanged sinyali → on_text_changed() metodunu tetikler.
-      - on_text_changed(): tokenize → parser.parse() → hata listesini statusBar’da göster.
+      - Her açık dosya tabWidget içinde ayrı bir sekmedir (CodeEditor + CSyntaxHighlighter).
+      - Tüm sekmeler tek bir Workspace’i, dolayısıyla tek bir lexer/parser iş havuzunu paylaşır.
+      - CodeEditor.contents_edited sinyali → on_text_changed() blokların token önbelleklerini
+        Workspace’e gönderir; token’ların birleştirilmesi ve parse işçi thread’inde yapılır.
+        Görünür sekme öncelikli, arka plandaki sekmeler kısıtlı olarak parse edilir.
+      - Analiz bitince analysis_ready sinyali ile sonuç GUI thread’ine taşınır ve
+        görünür sekmenin hata listesi statusBar’da, fonksiyonları outline panelinde gösterilir.
+      - Workspace bellek bütçesini aşınca arka plandaki sekmelerin blok token önbellekleri
+        boşaltılır (cache_evicted); sekme tekrar açıldığında yeniden kurulur.
+      - Diskten açılan dosyalar için içerik hash’iyle bir anlık görüntü (snapshot.py) aranır;
+        bulunursa vurgular ve hatalar lex/parse yapılmadan geri yüklenir. Bulunamazsa ilk
+        analizden sonra anlık görüntü yazılır.
     """
 
+    # İşçi thread’inden GUI thread’ine (doc_id, AnalysisResult) taşır
+    analysis_ready = pyqtSignal(object, object)
+    # Workspace’in bütçe nedeniyle önbelleğini attığı belgenin doc_id’si (işçi thread’inden de gelir)
+    cache_evicted = pyqtSignal(object)
+
     def __init__(self) -> None:
         super().__init__()
         self.window = Ui_MainWindow()    # PyQt5 Designer ile oluşturulmuş UI sınıfı
         self.window.setupUi(self)        # UI elemanlarını inşa eder
 
-        # 1) Sözdizimi vurgulayıcıyı textEdit’in document’ına bağla
-        self.highlighter = CSyntaxHighlighter(self.window.textEdit.document())
+        # doc_id → (CodeEditor, CSyntaxHighlighter, dosya yolu)
+        self.editors = {}
+        # doc_id → diskteki içeriğin anahtarı; anlık görüntüsü henüz yazılmamış belgeler
+        self._unsaved_snapshots = {}
+        self._next_doc_id = itertools.count(1)
+
+        # 1) Paylaşılan iş havuzu ve belge önbelleği
+        self.analysis_ready.connect(self.on_analysis_ready)
+        self.cache_evicted.connect(self.on_cache_evicted)
+        self.workspace = Workspace(on_result=self.analysis_ready.emit,
+                                   on_evict=self.cache_evicted.emit)
+
+        # 2) Sekme ve menü sinyalleri
+        self.window.tabWidget.currentChanged.connect(self.on_tab_changed)
+        self.window.tabWidget.tabCloseRequested.connect(self.close_tab)
+        self.window.actionNew.triggered.connect(lambda: self.new_tab())
+        self.window.actionOpen.triggered.connect(self.open_file_dialog)
+        self.window.actionClose.triggered.connect(
+            lambda: self.close_tab(self.window.tabWidget.currentIndex()))
+        self.window.outlineList.itemActivated.connect(self.on_outline_activated)
+
+        # Boş bir başlangıç sekmesi
+        self.new_tab()
+
+    def new_tab(self, text: str = "", path: str = None, snapshot=None, key: str = None) -> int:
+        """
+        Yeni bir düzenleyici sekmesi açar, Workspace’e kaydeder ve doc_id döner.
+        snapshot verilirse blok önbellekleri ve analiz sonucu ondan kurulur. key, diskteki
+        içeriğin anahtarıdır; anlık görüntü kullanılamadıysa ilk analizden sonra bu anahtarla
+        yazılır.
+        """
+        doc_id = next(self._next_doc_id)
+        editor = CodeEditor()
+        editor.setFont(self.window.tabWidget.font())
+        editor.setStyleSheet("background-color: #dcdcdc;")
+        highlighter = CSyntaxHighlighter(editor.document())
+        result = None
+        if snapshot is None:
+            editor.setPlainText(text)
+        else:
+            if editor.restore(text, highlighter, snapshot):
+                # Satırlar lex’lenmeden boyandı; parser sonucu da anlık görüntüden gelir
+                result = AnalysisResult(0, snapshot.token_count, snapshot.errors, snapshot.outline)
+            snapshot.close()
+        self.editors[doc_id] = (editor, highlighter, path)
+        if result is None and key is not None:
+            self._unsaved_snapshots[doc_id] = key
+
+        # Sekme Workspace’e kaydedilmeden önce görünür yapılır: belge aktif olarak açılır
+        # (sonucu arka plan bütçesine takılıp atılmaz) ve on_tab_changed hazır sonucu
+        # açılış sırasında statusBar’a yazmaz
+        title = os.path.basename(path) if path else "untitled"
+        editor.setProperty("doc_id", doc_id)
+        index = self.window.tabWidget.addTab(editor, title)
+        self.window.tabWidget.setCurrentIndex(index)
+
+        # Anlık görüntüden gelen sonuç için kaynak gerekmez; önbellek atılırsa on_tab_changed verir
+        self.workspace.open(doc_id, editor.line_tokens() if result is None else None, result)
+        editor.contents_edited.connect(lambda: self.on_text_changed(doc_id))
+        if result is not None:
+            # Hataların satırlara işlenmesi ve statusBar/outline, pencere metinle birlikte
+            # çizildikten sonraya bırakılır (normal açılışta da sonuç sonradan gelir)
+            QTimer.singleShot(0, lambda: self.on_analysis_ready(doc_id, result))
+        return doc_id
+
+    def open_file(self, path: str) -> int:
+        """
+        Diskteki bir C dosyasını yeni sekmede açar. İçeriğe ait bir anlık görüntü varsa
+        vurgular ve hatalar ondan geri yüklenir; yoksa belge arka planda analiz edilir ve
+        sonuç anlık görüntü olarak kaydedilir.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        key = content_key(data)
+        return self.new_tab(data.decode("utf-8", errors="replace"), path, load_snapshot(key), key)
+
+    def open_file_dialog(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "Open C files", "",
+                                                "C sources (*.c *.h);;All files (*)")
+        for path in paths:
+            self.open_file(path)
+
+    def close_tab(self, index: int):
+        editor = self.window.tabWidget.widget(index)
+        if editor is None:
+            return
+        doc_id = editor.property("doc_id")
+        self.window.tabWidget.removeTab(index)
+        self.workspace.close(doc_id)
+        self.editors.pop(doc_id, None)
+        self._unsaved_snapshots.pop(doc_id, None)
+        editor.deleteLater()
 
-        # 2) Metin değiştiğinde parse et ve hata varsa statusBar’da göster
-        self.window.textEdit.textChanged.connect(self.on_text_changed)
+    def current_doc_id(self):
+        editor = self.window.tabWidget.currentWidget()
+        return editor.property("doc_id") if editor is not None else None
 
-    def on_text_changed(self):
+    def on_tab_changed(self, index: int):
         """
-        Kullanıcı textEdit içeriğini her değiştirdiğinde çalışır.
-        - Kodu al (string).
-        - tokenize(code) ile token listesine dönüştür.
-        - Parser(token list) oluştur, parse() ile sözdizimi hatalarını al.
-        - Eğer errors listesi doluysa, “Line X, Col Y: mesaj” biçiminde statusBar’da göster.
-          Yoksa “No syntax errors” mesajı çıkar.
+        Görünür sekme değişti: Workspace’te aktif belgeyi güncelle ve önbellekte sonuç
+        varsa hemen göster. Önbellek bütçe nedeniyle atılmışsa blok token’ları yeniden kurulur
+        ve belge yeniden analiz edilir.
         """
-        code = self.window.textEdit.toPlainText()
-        # a) Lexical analysis (tokenize)
-        tokens = tokenize(code)
-        # b) Syntax analysis (parse)
-        parser = Parser(tokens)
-        errors = parser.parse()
+        doc_id = self.current_doc_id()
+        if doc_id is None:
+            self.window.statusbar.clearMessage()
+            self.window.outlineList.clear()
+            return
+        self.workspace.activate(doc_id)
+        result = self.workspace.result(doc_id)
+        if result is not None:
+            self.show_errors(result.errors)
+            self.show_outline(result.outline)
+        else:
+            if self.workspace.needs_source(doc_id):
+                self.workspace.update(doc_id, self.editors[doc_id][0].line_tokens())
+            self.window.statusbar.showMessage("Analyzing...")
+
+    def on_cache_evicted(self, doc_id):
+        """
+        Workspace bellek bütçesi nedeniyle arka plandaki bir belgenin sonucunu attı: sekmenin
+        blok token önbellekleri de boşaltılır. Sinyal işçi thread’inden geldiyse sekme bu arada
+        görünür olmuş olabilir; görünür sekmenin önbelleği boşaltılmaz.
+        """
+        entry = self.editors.get(doc_id)
+        if entry is not None and doc_id != self.current_doc_id():
+            entry[0].release_token_caches()
+
+    def on_text_changed(self, doc_id):
+        """
+        Kullanıcı bir sekmenin içeriğini her değiştirdiğinde çalışır.
+        - Blokların vurgulayıcıda lex’lenmiş token listeleri (CodeEditor.line_tokens) yalnızca
+          referans olarak toplanır; belge yeniden lex’lenmez, metin kopyalanmaz.
+        - Token’ların mutlak konumlu listeye birleştirilmesi ve parse paylaşılan havuzda çalışır;
+          sonuç on_analysis_ready’e gelir.
+        """
+        editor = self.editors[doc_id][0]
+        self.workspace.update(doc_id, editor.line_tokens())
+
+    def on_analysis_ready(self, doc_id, result):
+        """
+        Hatalar sekmenin satır numarası alanına işlenir. Sonuç görünür sekmeye aitse
+        statusBar’a da yansıtılır; arka plan sekmelerinin sonuçları Workspace önbelleğinde bekler.
+        """
+        entry = self.editors.get(doc_id)
+        if entry is None:
+            return
+        entry[0].set_diagnostics(result.errors)
+        if doc_id == self.current_doc_id():
+            self.show_errors(result.errors)
+            self.show_outline(result.outline)
+        self.save_snapshot(doc_id, result)
+
+    def save_snapshot(self, doc_id, result):
+        """
+        Dosyanın diskteki içeriğine ait ilk analiz sonucunu anlık görüntü olarak yazar.
+        Belge açıldıktan sonra değiştirildiyse (içerik artık anahtarla eşleşmiyorsa) ya da
+        analiz hata verdiyse yazılmaz.
+        """
+        key = self._unsaved_snapshots.get(doc_id)
+        if key is None or result.failed:
+            return
+        editor = self.editors[doc_id][0]
+        if editor.document().isModified():
+            return
+        del self._unsaved_snapshots[doc_id]
+        write_snapshot(key, editor.line_caches(), result.errors, result.outline)
+
+    def show_outline(self, outline):
+        """
+        Outline paneline üst seviyedeki fonksiyonları (isim, satır) listeler.
+        """
+        widget = self.window.outlineList
+        widget.clear()
+        for name, line, col in outline:
+            item = QListWidgetItem(f"{name}()  :{line}")
+            item.setData(Qt.UserRole, (line, col))
+            widget.addItem(item)
 
+    def on_outline_activated(self, item):
+        """
+        Outline’da seçilen fonksiyonun tanımına gider.
+        """
+        doc_id = self.current_doc_id()
+        if doc_id is None:
+            return
+        line, col = item.data(Qt.UserRole)
+        self.editors[doc_id][0].go_to(line, col)
+
+    def show_errors(self, errors):
+        """
+        Eğer errors listesi doluysa, “Line X, Col Y: mesaj” biçiminde statusBar’da göster.
+        Yoksa “No syntax errors” mesajı çıkar.
+        """
         # Hata listesi dolu mu?
         if errors:
             msgs = []
@@ -206,3 +362,7 @@ class Highlighter(QMainWindow):
         else:
             # Hata yoksa temizle veya “No syntax errors” yaz
             self.window.statusbar.showMessage("No syntax errors")
+
+    def closeEvent(self, event):
+        self.workspace.shutdown()
+        super().closeEvent(event)
@@ -0,0 +1,60 @@
+# bench_corpus.py
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fuzz import CORPUS_DIR, DEFAULT_SIZES, DEFAULT_SLOPE, load_corpus, profile  # noqa: E402
+
+# ----------------------------------------
+# PERFORMANS REGRESYON KORPUSU
+# ----------------------------------------
+#
+# fuzz.py’ın küçültüp benchmarks/corpus/ altına yazdığı şablonları yeniden ölçer.
+# Her vaka, bulunduğu andaki kararıyla (found) birlikte listelenir. Henüz düzeltilmemiş vakalar
+# JSON’da "known" alanıyla beklenen kararı taşır:
+#   - ok:    Karar yok (temiz).
+#   - XFAIL: Karar "known" ile aynı; bilinen sorun, başarısızlık sayılmaz.
+#   - FAIL:  "known" olmayan bir vakada ya da "known"dan farklı bir karar (yeni regresyon).
+#   - XPASS: "known" işaretli vaka artık temiz; "known" alanı kaldırılmalı.
+# FAIL veya XPASS varsa çıkış kodu 1 olur.
+#
+# Kullanım:
+#   python benchmarks/bench_corpus.py [--slope 1.3] [--corpus DIZIN]
+
+
+def classify(verdict, known) -> str:
+    """
+    Ölçülen karar ve korpustaki "known" alanından vakanın durumunu belirler.
+    """
+    if known:
+        if verdict is None:
+            return "XPASS"
+        return "XFAIL" if verdict == known else "FAIL"
+    return "FAIL" if verdict else "ok"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Re-run the minimized fuzz corpus.")
+    ap.add_argument("--corpus", default=CORPUS_DIR)
+    ap.add_argument("--slope", type=float, default=DEFAULT_SLOPE)
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    args = ap.parse_args(argv)
+
+    cases = load_corpus(args.corpus)
+    counts = {"ok": 0, "XFAIL": 0, "FAIL": 0, "XPASS": 0}
+    for case, data in cases:
+        prof = profile(case, tuple(args.sizes))
+        status = classify(prof.verdict(args.slope), data.get("known"))
+        counts[status] += 1
+        print(f"{status:5s}  {case.name:32s} found {data.get('found', '?'):22s} now {prof.summary()}")
+
+    print(f"\n{len(cases)} case(s): {counts['ok']} ok, {counts['XFAIL']} known, "
+          f"{counts['FAIL']} failing, {counts['XPASS']} unexpectedly passing")
+    sys.exit(1 if counts["FAIL"] or counts["XPASS"] else 0)
+
+
+if __name__ == "__main__":
+    main()
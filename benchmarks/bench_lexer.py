@@ -0,0 +1,155 @@
+# bench_lexer.py
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from parseTree import tokenize, Token  # noqa: E402
+
+# ----------------------------------------
+# LEXER KARŞILAŞTIRMA BENCHMARK’I
+# ----------------------------------------
+#
+# Güncel C11 lexer’ını (parseTree.tokenize), eski kısmi token tablosuyla çalışan lexer’la
+# aynı kaynak dosyalar üzerinde karşılaştırır. Eski lexer, karşılaştırma için aşağıda
+# olduğu gibi korunmuştur (LEGACY_SPECIFICATION + legacy_tokenize).
+#
+# Kullanım:
+#   python benchmarks/bench_lexer.py [dosya veya dizin ...] [--repeat N]
+# Dizinler içindeki *.c ve *.h dosyaları taranır. Argüman verilmezse /usr/include kullanılır.
+# Her dosya için en iyi (minimum) süre alınır; toplam süre, token sayısı ve UNKNOWN token
+# sayısı (per-karakter MISMATCH yoluna düşen karakterler) raporlanır.
+
+LEGACY_SPECIFICATION: List[Tuple[str, str]] = [
+    ("PREPROCESSOR",     r"^\s*#.*"),
+    ("COMMENT1",         r"//[^\n]*"),
+    ("COMMENT2_START",   r"/\*"),
+    ("COMMENT2_END",     r"\*/"),
+    ("STRING_LITERAL",   r"\"(?:\\.|[^\"\\])*\""),
+    ("CHAR_LITERAL",     r"'(?:\\.|[^'\\])*'"),
+    ("KEYWORD",          r"\b(?:int|char|void|if|else|while|for|return|struct|union|typedef)\b"),
+    ("NUMBER",           r"\b[0-9]+(?:\.[0-9]*)?(?:[eE][+-]?[0-9]+)?\b"),
+    ("HEXNUMBER",        r"\b0[xX][0-9A-Fa-f]+\b"),
+    ("IDENTIFIER",       r"\b[A-Za-z_][A-Za-z0-9_]*\b"),
+    ("OP",               r"==|!=|<=|>=|\+\+|--|\+=|-=|\*=|/=|&&|\|\||<<|>>|->|"
+                         r"[+\-*/%<>&\^|=~!?:]"),
+    ("SEPARATOR",        r"[;,()\[\]\{\}]"),
+    ("SKIP",             r"[ \t\r\n]+"),
+    ("MISMATCH",         r"."),
+]
+
+_LEGACY_REGEX = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in LEGACY_SPECIFICATION),
+    re.MULTILINE
+)
+
+
+def legacy_tokenize(code: str) -> List[Token]:
+    """
+    Eski tokenize() döngüsü (finditer + yorum için kalan metnin kopyası).
+    """
+    tokens: List[Token] = []
+    line_num = 1
+    line_start = 0
+    idx_iter = iter(_LEGACY_REGEX.finditer(code))
+    for mo in idx_iter:
+        kind = mo.lastgroup
+        value = mo.group(kind)
+        start_pos = mo.start()
+        if kind == "SKIP":
+            newlines = value.count("\n")
+            if newlines:
+                line_num += newlines
+                line_start = mo.end() - (value.rfind("\n") + 1)
+            continue
+        if kind == "COMMENT2_START":
+            rest = code[mo.end():]
+            end_match = re.search(r"\*/", rest)
+            if end_match:
+                comment_text = code[mo.start(): mo.end() + end_match.end()]
+                inner = code[mo.end(): mo.end() + end_match.end()]
+                ln = inner.count("\n")
+                if ln:
+                    line_num += ln
+                    line_start = mo.end() + end_match.end() - (inner.rfind("\n") + 1)
+                tokens.append(Token("COMMENT2", comment_text, mo.start(),
+                                    line_num, mo.start() - line_start + 1))
+                for _ in range(end_match.end()):
+                    next(idx_iter, None)
+                continue
+            else:
+                tokens.append(Token("COMMENT2", code[mo.start():], mo.start(),
+                                    line_num, mo.start() - line_start + 1))
+                break
+        tokens.append(Token("UNKNOWN" if kind == "MISMATCH" else kind, value, start_pos,
+                            line_num, start_pos - line_start + 1))
+        if "\n" in value:
+            line_num += value.count("\n")
+            line_start = mo.end() - (value.rfind("\n") + 1)
+    return tokens
+
+
+def collect_sources(paths: List[str]) -> List[str]:
+    """
+    Verilen dosya/dizinlerden *.c ve *.h dosyalarını toplar.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, n) for n in names if n.endswith((".c", ".h")))
+        elif os.path.isfile(path):
+            files.append(path)
+    return sorted(files)
+
+
+def best_time(fn, code: str, repeat: int) -> Tuple[float, List[Token]]:
+    best = float("inf")
+    tokens = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        tokens = fn(code)
+        best = min(best, time.perf_counter() - t0)
+    return best, tokens
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compare the C11 lexer with the legacy partial lexer.")
+    ap.add_argument("paths", nargs="*", default=["/usr/include"])
+    ap.add_argument("--repeat", type=int, default=3, help="runs per file; the best time is kept")
+    ap.add_argument("--limit", type=int, default=0, help="benchmark at most this many files")
+    args = ap.parse_args(argv)
+
+    files = collect_sources(args.paths)
+    if args.limit:
+        files = files[:args.limit]
+    if not files:
+        ap.error("no .c/.h sources found")
+
+    totals = {"new": [0.0, 0, 0], "legacy": [0.0, 0, 0]}   # süre, token, UNKNOWN
+    size = 0
+    for path in files:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            code = f.read()
+        size += len(code)
+        for name, fn in (("new", tokenize), ("legacy", legacy_tokenize)):
+            elapsed, tokens = best_time(fn, code, args.repeat)
+            totals[name][0] += elapsed
+            totals[name][1] += len(tokens)
+            totals[name][2] += sum(1 for t in tokens if t.type == "UNKNOWN")
+
+    print(f"{len(files)} files, {size / 1024:.0f} KiB")
+    print(f"{'lexer':<8}{'time (s)':>10}{'MB/s':>8}{'tokens':>10}{'UNKNOWN':>10}")
+    for name in ("legacy", "new"):
+        elapsed, count, unknown = totals[name]
+        print(f"{name:<8}{elapsed:>10.3f}{size / elapsed / 1e6:>8.2f}{count:>10}{unknown:>10}")
+    print(f"speedup: {totals['legacy'][0] / totals['new'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+# fuzz.py
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from parseTree import tokenize, Parser  # noqa: E402
+
+# ----------------------------------------
+# LEXER/PARSER PERFORMANS FUZZ’I
+# ----------------------------------------
+#
+# Patolojik girdiler (derin iç içe parantezler, kapanmamış tırnak dizileri, binlerce “/*” …)
+# tek bir boyutta değil, büyüyen boyutlarda ölçülür. Her girdi bir “pompa” şablonudur:
+#
+#     metin(n) = head + prefix * n + body + suffix * n + tail
+#
+# Böylece hem art arda tekrar (suffix boş) hem iç içe yapı (prefix “(”, suffix “)”) aynı
+# biçimde büyütülür. Her boyutta tokenize + Parser.parse süresi (en iyi deneme) ve
+# tracemalloc ile tepe bellek ölçülür; log(boyut)–log(süre) doğrusunun eğimi --slope
+# eşiğini aşarsa girdi süper-doğrusal sayılır. İstisna (ör. RecursionError) ayrıca raporlanır.
+#
+# Şablonlar gramer tabanlı tohumlardan (SEEDS) başlar ve rastgele mutasyonlarla (parça ekleme,
+# silme, çoğaltma) türetilir. Bulunan vakalar delta debugging (ddmin) ile küçültülür ve
+# benchmarks/corpus/ altına JSON olarak yazılır; bench_corpus.py bu korpusu yeniden çalıştırır.
+#
+# Kullanım:
+#   python benchmarks/fuzz.py [--iterations N] [--seed S] [--slope 1.3] [--save]
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+DEFAULT_SIZES = (250, 500, 1000, 2000)
+DEFAULT_SLOPE = 1.3
+DEFAULT_TIME_LIMIT = 2.0     # Bir ölçüm bu süreyi aşarsa daha büyük boyutlar denenmez
+
+_FIELDS = ("head", "prefix", "body", "suffix", "tail")
+
+# Mutasyonlarda eklenen C parçaları
+FRAGMENTS = [
+    "(", ")", "{", "}", "[", "]", "if (x) ", "else ", "else if (x) ", "while (x) ",
+    "for (;;) ", "return ", "x", "1", "+", "-", "!", "=", "==", ";", ",", "\"", "'", "\\",
+    "/*", "*/", "//", "#", "\n", " ", "int ", "x = ", "0x", "1e", "L\"", "?", ":",
+]
+
+
+class Case:
+    """
+    Tek bir pompa şablonu; build(n) ile n kez büyütülmüş metni üretir.
+    """
+
+    def __init__(self, head: str = "", prefix: str = "", body: str = "", suffix: str = "",
+                 tail: str = "", name: str = ""):
+        self.head = head
+        self.prefix = prefix
+        self.body = body
+        self.suffix = suffix
+        self.tail = tail
+        self.name = name
+
+    def build(self, n: int) -> str:
+        return self.head + self.prefix * n + self.body + self.suffix * n + self.tail
+
+    def key(self) -> str:
+        raw = "\0".join(getattr(self, f) for f in _FIELDS)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:10]
+
+    def to_dict(self) -> dict:
+        return {f: getattr(self, f) for f in _FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: dict, name: str = "") -> "Case":
+        return cls(*(data.get(f, "") for f in _FIELDS), name=name or data.get("name", ""))
+
+    def __repr__(self):
+        return "Case(" + ", ".join(f"{f}={getattr(self, f)!r}" for f in _FIELDS if getattr(self, f)) + ")"
+
+
+# Gramer tabanlı tohumlar: bilinen riskli yapıların büyütülebilir biçimleri
+SEEDS = [
+    Case("int f() {\n x = ", "(", "1", ")", ";\n}\n", "nested-parens"),
+    Case("int f() {\n x = ", "-", "1", "", ";\n}\n", "unary-chain"),
+    Case("int f() {\n x = 1", " + 1", "", "", ";\n}\n", "binary-chain"),
+    Case("int f() {\n", "{", "", "}", "\n}\n", "nested-blocks"),
+    Case("int f() {\n", "if (x) ", "x;", "", "\n}\n", "nested-if"),
+    Case("int f() {\n if (x) x;\n", "else if (x) x;\n", "", "", "}\n", "else-if-chain"),
+    Case("int f() {\n", "while (x) ", ";", "", "\n}\n", "nested-while"),
+    Case("int f() {\n", "x = 1;\n", "", "", "}\n", "statements"),
+    Case("", "\"", "", "", "", "unmatched-quotes"),
+    Case("", "\"\\", "", "", "", "escaped-quotes"),
+    Case("", "/*", "", "", "", "comment-openers"),
+    Case("", "#define X \\\n", "", "", "", "continued-directive"),
+    Case("", "int x;\n", "", "", "", "declarations"),
+]
+
+
+# -- Ölçüm ---------------------------------------------------------------
+
+def run_once(text: str):
+    Parser(tokenize(text)).parse()
+
+
+def measure(text: str, repeat: int = 3) -> Tuple[float, int, Optional[str]]:
+    """
+    (en iyi süre, tepe bellek baytı, istisna adı veya None) döner.
+    Süre tracemalloc kapalıyken ölçülür; bellek ayrı bir çalıştırmada alınır.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            run_once(text)
+        except Exception as exc:   # RecursionError, IndexError … hepsi bulgudur
+            return time.perf_counter() - start, 0, type(exc).__name__
+        best = min(best, time.perf_counter() - start)
+        if best > DEFAULT_TIME_LIMIT:
+            break
+
+    tracemalloc.start()
+    try:
+        run_once(text)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak, None
+
+
+def slope(xs: List[float], ys: List[float]) -> float:
+    """
+    log(x)–log(y) en küçük kareler doğrusunun eğimi (1 ≈ doğrusal, 2 ≈ karesel).
+    """
+    lx = [math.log(x) for x in xs]
+    ly = [math.log(max(y, 1e-9)) for y in ys]
+    mx, my = sum(lx) / len(lx), sum(ly) / len(ly)
+    den = sum((x - mx) ** 2 for x in lx)
+    return sum((x - mx) * (y - my) for x, y in zip(lx, ly)) / den if den else 0.0
+
+
+class Profile:
+    """
+    Bir şablonun boyutlara göre ölçümü ve kararı.
+    - rows:         (n, karakter sayısı, süre, tepe bellek) listesi.
+    - error:        İstisna adı (varsa) ve oluştuğu n.
+    - time_slope / memory_slope: log-log eğimleri.
+    """
+
+    def __init__(self, case: Case):
+        self.case = case
+        self.rows: List[Tuple[int, int, float, int]] = []
+        self.error: Optional[str] = None
+        self.error_size = 0
+        self.time_slope = 0.0
+        self.memory_slope = 0.0
+
+    def verdict(self, threshold: float) -> Optional[str]:
+        """
+        "error:<İstisna>", "time" / "memory" (süper-doğrusal) ya da None (temiz).
+        """
+        if self.error:
+            return f"error:{self.error}"
+        if self.time_slope > threshold:
+            return "time"
+        if self.memory_slope > threshold:
+            return "memory"
+        return None
+
+    def summary(self) -> str:
+        if self.error:
+            return f"{self.error} at n={self.error_size}"
+        return f"time slope {self.time_slope:.2f}, memory slope {self.memory_slope:.2f}"
+
+
+def profile(case: Case, sizes=DEFAULT_SIZES, repeat: int = 3,
+            time_limit: float = DEFAULT_TIME_LIMIT) -> Profile:
+    result = Profile(case)
+    for n in sizes:
+        text = case.build(n)
+        elapsed, peak, error = measure(text, repeat)
+        if error:
+            result.error, result.error_size = error, n
+            return result
+        result.rows.append((n, len(text), elapsed, peak))
+        if elapsed > time_limit:
+            break
+    if len(result.rows) >= 2:
+        lengths = [r[1] for r in result.rows]
+        result.time_slope = slope(lengths, [r[2] for r in result.rows])
+        result.memory_slope = slope(lengths, [r[3] for r in result.rows])
+    return result
+
+
+# -- Mutasyon ------------------------------------------------------------
+
+def mutate(case: Case, rnd: random.Random) -> Case:
+    """
+    Şablonun prefix/body/suffix alanlarından birine rastgele parça ekler, bir karakter
+    siler ya da alanı çoğaltır.
+    """
+    new = Case(**case.to_dict(), name=case.name)
+    for _ in range(rnd.randint(1, 3)):
+        field = rnd.choice(("prefix", "body", "suffix"))
+        value = getattr(new, field)
+        op = rnd.random()
+        if op < 0.6 or not value:
+            at = rnd.randint(0, len(value))
+            value = value[:at] + rnd.choice(FRAGMENTS) + value[at:]
+        elif op < 0.85:
+            at = rnd.randrange(len(value))
+            value = value[:at] + value[at + 1:]
+        else:
+            value = value * 2
+        setattr(new, field, value)
+    if not new.prefix:
+        new.prefix = rnd.choice(FRAGMENTS)
+    return new
+
+
+# -- Küçültme (ddmin) ----------------------------------------------------
+
+def _ddmin(value: str, keeps: Callable[[str], bool]) -> str:
+    """
+    Klasik delta debugging: value’dan parçalar çıkarılmaya çalışılır; keeps(aday) doğru
+    kaldığı sürece küçültülmüş aday kabul edilir.
+    """
+    chunks = 2
+    while len(value) >= 1:
+        size = max(1, len(value) // chunks)
+        reduced = False
+        for start in range(0, len(value), size):
+            candidate = value[:start] + value[start + size:]
+            if keeps(candidate):
+                value = candidate
+                chunks = max(chunks - 1, 2)
+                reduced = True
+                break
+        if not reduced:
+            if size == 1:
+                break
+            chunks = min(len(value), chunks * 2)
+    return value
+
+
+def minimize(case: Case, verdict: str, threshold: float, sizes=DEFAULT_SIZES) -> Case:
+    """
+    Şablonun her alanını, karar (istisna türü ya da süper-doğrusallık) korunacak şekilde
+    küçültür. prefix boşaltılamaz (büyütülecek bir şey kalmalı).
+    """
+    current = Case(**case.to_dict(), name=case.name)
+
+    def keeps(field: str, value: str) -> bool:
+        if field == "prefix" and not value:
+            return False
+        trial = Case(**current.to_dict())
+        setattr(trial, field, value)
+        return profile(trial, sizes, repeat=2).verdict(threshold) == verdict
+
+    for field in ("tail", "head", "body", "suffix", "prefix"):
+        setattr(current, field, _ddmin(getattr(current, field), lambda v: keeps(field, v)))
+    return current
+
+
+# -- Korpus ---------------------------------------------------------------
+
+def load_corpus(directory: str = CORPUS_DIR) -> List[Tuple[Case, dict]]:
+    cases = []
+    if not os.path.isdir(directory):
+        return cases
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                data = json.load(f)
+            cases.append((Case.from_dict(data, name[:-5]), data))
+    return cases
+
+
+def save_case(case: Case, prof: Profile, verdict: str, directory: str = CORPUS_DIR) -> str:
+    os.makedirs(directory, exist_ok=True)
+    base = case.name or "case"
+    path = os.path.join(directory, f"{base}-{case.key()}.json")
+    data = case.to_dict()
+    data.update({"name": base, "found": verdict, "detail": prof.summary()})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return path
+
+
+def fuzz(iterations: int, seed: int, threshold: float, save: bool,
+         sizes=DEFAULT_SIZES) -> List[Tuple[Case, Profile, str]]:
+    """
+    Önce tohumları olduğu gibi, ardından mutasyonlarını ölçer. Bulguları küçültür ve
+    (save ise) korpusa yazar. Aynı küçültülmüş şablon iki kez raporlanmaz.
+    """
+    rnd = random.Random(seed)
+    known = {case.key() for case, _ in load_corpus()}
+    findings = []
+    for i in range(iterations):
+        base = SEEDS[i] if i < len(SEEDS) else mutate(rnd.choice(SEEDS), rnd)
+        prof = profile(base, sizes)
+        verdict = prof.verdict(threshold)
+        print(f"[{i:4d}] {base.name:20s} {prof.summary():40s} {verdict or 'ok'}")
+        if verdict is None:
+            continue
+        small = minimize(base, verdict, threshold, sizes)
+        if small.key() in known:
+            continue
+        known.add(small.key())
+        small_prof = profile(small, sizes)
+        findings.append((small, small_prof, verdict))
+        print(f"       minimized → {small!r}")
+        if save:
+            print(f"       saved {save_case(small, small_prof, verdict)}")
+    return findings
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Fuzz tokenize/Parser for super-linear behaviour.")
+    ap.add_argument("--iterations", type=int, default=len(SEEDS) + 50)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--slope", type=float, default=DEFAULT_SLOPE,
+                    help="log-log slope above which growth counts as super-linear")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                    help="pump counts n to measure")
+    ap.add_argument("--save", action="store_true", help="write minimized findings to benchmarks/corpus")
+    args = ap.parse_args(argv)
+
+    findings = fuzz(args.iterations, args.seed, args.slope, args.save, tuple(args.sizes))
+    print(f"\n{len(findings)} new finding(s)")
+    for case, prof, verdict in findings:
+        print(f"  {verdict:22s} {case!r}  ({prof.summary()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# brackets.py
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Tuple
+
+from parseTree import Token
+
+# ----------------------------------------
+# PARANTEZ / SÜSLÜ PARANTEZ EŞLEŞTİRME İNDEKSİ
+# ----------------------------------------
+#
+# Token akışındaki SEPARATOR token’larından ( ) [ ] { } olanlar ve digraph karşılıkları
+# (<: :> → [ ], <% %> → { }) tek geçişte, bir yığın (stack) yardımıyla eşleştirilir. Sonuç üç paralel int dizisinde tutulur:
+#   - positions: Her parantezin belgedeki mutlak karakter indeksi (artan sırada).
+#   - kinds:     Parantez türü; BRACKETS içindeki sırası (0–2 açılış, 3–5 kapanış).
+#   - match:     Eşleşen parantezin dizideki indeksi; eşi yoksa -1.
+# İmleç hareketi yalnızca positions üzerinde ikili arama yapar (yeniden tarama yok).
+# Düzenlemelerde shift() konumları kaydırır, replace() yalnızca değişen aralığın parantezlerini
+# değiştirir; eşleştirme tablosu yalnızca parantez dizisi gerçekten değiştiyse yeniden kurulur.
+
+BRACKETS = "([{)]}"
+_KIND = {ch: i for i, ch in enumerate(BRACKETS)}
+# Digraph’lar karşılık geldikleri parantezin türünü alır; <% … %> de bir { … } bloğudur
+_KIND.update({"<:": _KIND["["], ":>": _KIND["]"], "<%": _KIND["{"], "%>": _KIND["}"]})
+_OPEN_COUNT = 3
+
+
+def bracket_tokens(tokens: Iterable[Token]) -> List[Tuple[int, str]]:
+    """
+    Token listesinden (pozisyon, değer) olarak parantez token’larını (digraph’lar dahil) seçer.
+    """
+    return [(t.position, t.value) for t in tokens
+            if t.type == "SEPARATOR" and t.value in _KIND]
+
+
+class BracketIndex:
+    """
+    Parantez eşleştirme tablosu. build() ile bir token listesinden oluşturulur.
+    """
+
+    def __init__(self):
+        self.positions = array("i")
+        self.kinds = array("b")
+        self.match = array("i")
+
+    @classmethod
+    def build(cls, tokens: Iterable[Token]) -> "BracketIndex":
+        index = cls()
+        for pos, ch in bracket_tokens(tokens):
+            index.positions.append(pos)
+            index.kinds.append(_KIND[ch])
+        index._rematch()
+        return index
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _rematch(self):
+        """
+        Yığın tabanlı tek geçiş: açılışlar yığına itilir, kapanış yığının tepesindeki aynı
+        türden açılışla eşleşir. Eşleşmeyen kapanışlar ve kapanmamış açılışlar -1 kalır.
+        """
+        kinds = self.kinds
+        match = array("i", [-1]) * len(kinds)
+        stack = []
+        for i, kind in enumerate(kinds):
+            if kind < _OPEN_COUNT:
+                stack.append(i)
+            elif stack and kinds[stack[-1]] == kind - _OPEN_COUNT:
+                j = stack.pop()
+                match[i] = j
+                match[j] = i
+        self.match = match
+
+    # -- Artımlı güncelleme ---------------------------------------------
+
+    def shift(self, position: int, removed: int, added: int):
+        """
+        QTextDocument.contentsChange(position, removed, added) karşılığı: silinen aralıktaki
+        parantezler çıkarılır, sonrasındakiler (added - removed) kadar kaydırılır.
+        Parantez silindiyse eşleştirme tablosu hemen yeniden kurulur; böylece yeni parantezler
+        replace() ile eklenene kadar da sorgular tutarlı kalır.
+        """
+        positions = self.positions
+        lo = bisect_left(positions, position)
+        hi = bisect_left(positions, position + removed)
+        delta = added - removed
+        if delta:
+            for i in range(hi, len(positions)):
+                positions[i] += delta
+        if hi > lo:
+            del positions[lo:hi]
+            del self.kinds[lo:hi]
+            self._rematch()
+
+    def replace(self, start: int, end: int, brackets: List[Tuple[int, str]]):
+        """
+        [start, end) aralığındaki parantezleri yeniden lex’lenmiş bloklardan gelen listeyle
+        değiştirir. Parantez dizisi (türleri) aynı kaldıysa eşleştirme tablosu aynen korunur.
+        """
+        lo = bisect_left(self.positions, start)
+        hi = bisect_left(self.positions, end)
+        new_kinds = array("b", [_KIND[ch] for _, ch in brackets])
+        changed = self.kinds[lo:hi] != new_kinds
+        self.positions[lo:hi] = array("i", [pos for pos, _ in brackets])
+        self.kinds[lo:hi] = new_kinds
+        if changed:
+            self._rematch()
+
+    # -- Sorgular -------------------------------------------------------
+
+    def find(self, position: int) -> int:
+        """
+        Tam olarak position’da duran parantezin indeksi; yoksa -1.
+        """
+        i = bisect_left(self.positions, position)
+        if i < len(self.positions) and self.positions[i] == position:
+            return i
+        return -1
+
+    def match_at(self, cursor: int) -> Optional[Tuple[int, int]]:
+        """
+        İmlecin hemen sağındaki ya da solundaki parantez ve eşinin pozisyonları.
+        Eşleşmeyen parantez için (pozisyon, -1) döner; imleç parantez yanında değilse None.
+        """
+        i = self.find(cursor)
+        if i < 0:
+            i = self.find(cursor - 1)
+        if i < 0:
+            return None
+        j = self.match[i]
+        return (self.positions[i], self.positions[j] if j >= 0 else -1)
+
+    def blocks_in(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        [start, end) aralığında açılan ve eşi aralığın dışında (sonrasında) kalan süslü
+        parantezler: (açılış pozisyonu, kapanış pozisyonu). Katlama bölgeleri buradan çıkar.
+        """
+        result = []
+        lo = bisect_left(self.positions, start)
+        hi = bisect_left(self.positions, end)
+        for i in range(lo, hi):
+            if self.kinds[i] == _KIND["{"]:
+                j = self.match[i]
+                if j >= 0 and self.positions[j] >= end:
+                    result.append((self.positions[i], self.positions[j]))
+        return result
@@ -0,0 +1,486 @@
+# code_editor.py
+
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import Qt, QRect, QSize, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter, QTextBlockUserData, QTextCursor
+from PyQt5.QtWidgets import QPlainTextEdit, QTextEdit, QWidget
+
+from parseTree import tokenize_line, LineTokens, Token, STATE_NORMAL
+from brackets import BRACKETS, BracketIndex, bracket_tokens
+
+# ----------------------------------------
+# KOD DÜZENLEYİCİ (QPlainTextEdit TABANLI)
+# ----------------------------------------
+#
+# QTextEdit’in zengin metin yerleşim motoru büyük düz metin dosyalarında yavaştır; CodeEditor
+# bunun yerine QPlainTextEdit kullanır. Her metin bloğu (satır) kendi token’larını BlockData
+# içinde saklar:
+#   - CSyntaxHighlighter.highlightBlock() bloğu tokenize_line() ile lex’ler ve sonucu BlockData’ya yazar.
+#   - Satır numarası alanı (LineNumberArea), aynı BlockData’daki UNKNOWN token’ları ve
+#     parser hatalarını kullanarak satırları işaretler.
+#   - Parantez indeksi (BracketIndex) yalnızca değişen blokların token’larıyla güncellenir;
+#     katlama (folding) bölgeleri ve imleçteki eş parantez vurgusu bu indeksten okunur.
+# Metin değişiklikleri QTextDocument.contentsChange(position, removed, added) ile takip edilir.
+# Art arda gelen değişiklikler contents_edited sinyalinde birleşir; ardından Workspace’e
+# blokların token listeleri (line_tokens) verilir ve işçi thread’inde join_line_tokens ile
+# birleştirilir.
+
+
+class BlockData(QTextBlockUserData):
+    """
+    Bir metin bloğunun (satırın) önbelleği:
+    - tokens:      tokenize_line() çıktısı (konumlar satır başına göre). None ise bellek bütçesi
+                   nedeniyle bırakılmıştır (CodeEditor.release_token_caches); tokens_for() kurar.
+    - start_state: Satırın lex’lendiği başlangıç durumu (önceki satırın sonu).
+    - state:       Satır sonundaki lexer durumu (STATE_NORMAL / STATE_COMMENT / STATE_PREPROCESSOR).
+    - errors:      Bu satıra düşen parser hataları, (kolon, mesaj) listesi.
+    - folded:      Bu satırda başlayan { … } bölgesi katlanmış mı.
+    - fresh:       Blok yeniden lex’lendi ama parantez indeksine henüz işlenmedi.
+    - text_hash:   Lex’lenen satır metninin hash’i; metin değişmeden yeniden vurgulanan
+                   blokların tekrar lex’lenmemesi için kullanılır (None: bilinmiyor).
+    """
+
+    def __init__(self, tokens: List[Token], start_state: int, state: int,
+                 text_hash: Optional[int] = None):
+        super().__init__()
+        self.tokens = tokens
+        self.start_state = start_state
+        self.state = state
+        self.text_hash = text_hash
+        self.errors: List[Tuple[int, str]] = []
+        self.folded = False
+        self.fresh = True
+
+    def tokens_for(self, text: str) -> List[Token]:
+        """
+        Bloğun token’ları; bırakılmışlarsa bloğun metni (text) başlangıç durumuyla yeniden lex’lenir.
+        """
+        if self.tokens is None:
+            self.tokens, _ = tokenize_line(text, self.start_state)
+        return self.tokens
+
+    def has_unknown(self, text: str) -> bool:
+        return any(t.type == "UNKNOWN" for t in self.tokens_for(text))
+
+
+class LineNumberArea(QWidget):
+    """
+    CodeEditor’ün sol kenarındaki satır numarası alanı; çizimi düzenleyiciye devreder.
+    """
+
+    def __init__(self, editor: "CodeEditor"):
+        super().__init__(editor)
+        self.editor = editor
+
+    def sizeHint(self) -> QSize:
+        return QSize(self.editor.line_number_area_width(), 0)
+
+    def paintEvent(self, event):
+        self.editor.line_number_area_paint_event(event)
+
+    def mousePressEvent(self, event):
+        # Katlama işaretine tıklanınca bölge katlanır/açılır
+        block = self.editor.block_at(event.pos().y())
+        if block.isValid():
+            self.editor.toggle_fold(block)
+
+
+class CodeEditor(QPlainTextEdit):
+    """
+    Satır numaralı, blok önbellekli C kod düzenleyicisi.
+    - contents_edited: Belge metni gerçekten değiştiğinde (biçim değişikliklerinde değil),
+      birden fazla değişiklik tek sinyalde birleştirilerek yayınlanır.
+    """
+
+    contents_edited = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.line_number_area = LineNumberArea(self)
+        self._error_blocks = []    # Hata yazılmış blokların numaraları (temizlemek için)
+
+        # Parantez indeksi ve son senkronizasyondan beri değişen karakter aralığı
+        self.brackets = BracketIndex()
+        self._dirty: Optional[Tuple[int, int]] = None
+        self._folding = False      # Katlama sırasında markContentsDirty düzenleme sayılmaz
+
+        # Art arda gelen contentsChange sinyalleri olay döngüsünün sonunda tek seferde işlenir
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(0)
+        self._edit_timer.timeout.connect(self.on_edit_timeout)
+
+        self.document().contentsChange.connect(self.on_contents_change)
+        self.blockCountChanged.connect(self.update_line_number_area_width)
+        self.updateRequest.connect(self.update_line_number_area)
+        self.cursorPositionChanged.connect(self.highlight_matching_bracket)
+        self.update_line_number_area_width()
+
+    # -- Metin ve token erişimi -----------------------------------------
+
+    def on_contents_change(self, position: int, removed: int, added: int):
+        """
+        QTextDocument.contentsChange: yalnızca değişen aralık bildirilir. Değişen blokları
+        CSyntaxHighlighter zaten yeniden lex’ler; burada parantez konumları kaydırılır,
+        değişen aralık kaydedilir ve analiz tetiklenir.
+        """
+        if self._folding:
+            return
+        if removed == added and self._text_unchanged(position, added):
+            # Yalnızca biçim değişikliği (ör. setCharFormat); metin ve token’lar aynı
+            return
+        self.brackets.shift(position, removed, added)
+        end = position + added
+        if self._dirty is not None:
+            start, old_end = self._dirty
+            # Önceki kirli aralığın sonu bu düzenlemeden sonra kalıyorsa o da kayar
+            if old_end >= position + removed:
+                old_end += added - removed
+            start = min(start, position)
+            end = max(end, min(old_end, self.document().characterCount()))
+            position = start
+        self._dirty = (position, end)
+        self._edit_timer.start()
+
+    def _text_unchanged(self, position: int, length: int) -> bool:
+        """
+        [position, position + length) aralığındaki tüm bloklar, son lex’lendikleri metni
+        (BlockData.text_hash) hâlâ taşıyor mu? Vurgulanmamış blok varsa False döner.
+        """
+        block = self.document().findBlock(position)
+        end = position + length
+        while block.isValid():
+            data = block.userData()
+            if not isinstance(data, BlockData) or data.text_hash != hash(block.text()):
+                return False
+            if block.position() + block.length() >= end:
+                return True
+            block = block.next()
+        return True
+
+    def on_edit_timeout(self):
+        self.sync_brackets()
+        self.contents_edited.emit()
+
+    def sync_brackets(self):
+        """
+        Kirli aralıktaki blokların (ve vurgulayıcının durum değişikliği yüzünden ardından
+        yeniden lex’lediği blokların) parantezlerini indekse işler. Belgenin geri kalanı
+        yeniden taranmaz.
+        """
+        if self._dirty is None:
+            return
+        doc = self.document()
+        start, end = self._dirty
+        self._dirty = None
+        first = doc.findBlock(start)
+        if not first.isValid():
+            first = doc.firstBlock()
+        last = doc.findBlock(end)
+        if not last.isValid():
+            last = doc.lastBlock()
+        while last.next().isValid():
+            data = last.next().userData()
+            if isinstance(data, BlockData) and not data.fresh:
+                break
+            last = last.next()
+
+        brackets = []
+        block = first
+        hidden = False
+        while True:
+            data = block.userData()
+            if isinstance(data, BlockData):
+                data.fresh = False
+                tokens = data.tokens_for(block.text())
+            else:
+                tokens, _ = tokenize_line(block.text(), max(block.previous().userState(), STATE_NORMAL))
+            base = block.position()
+            brackets.extend((base + pos, ch) for pos, ch in bracket_tokens(tokens))
+            hidden = hidden or not block.isVisible()
+            if block == last:
+                break
+            block = block.next()
+        self.brackets.replace(first.position(), last.position() + last.length(), brackets)
+        if hidden:
+            # Katlanmış bir bölgenin içi değişti; bölge sınırları artık geçersiz olabilir
+            self.unfold_all()
+        self.highlight_matching_bracket()
+
+    def restore(self, text: str, highlighter, snapshot) -> bool:
+        """
+        Metni, bağlı vurgulayıcı satırların token’larını anlık görüntüden (snapshot.Snapshot)
+        alacak şekilde yükler. Yükleme bir düzenleme sayılmaz: contents_edited yayınlanmaz,
+        parantez indeksi (normal yüklemede olduğu gibi) olay döngüsünün ilk turunda kurulur.
+        Satır sayısı tutmazsa bloklar yeniden lex’lenir, normal bir yükleme gibi devam edilir
+        ve False döner.
+        """
+        highlighter.snapshot = snapshot
+        try:
+            self.setPlainText(text)
+        finally:
+            highlighter.snapshot = None
+        doc = self.document()
+        if doc.blockCount() != snapshot.line_count:
+            block = doc.firstBlock()
+            while block.isValid():
+                block.setUserData(None)
+                block = block.next()
+            highlighter.rehighlight()
+            return False
+        self._edit_timer.stop()
+        QTimer.singleShot(0, self.sync_brackets)
+        return True
+
+    def _cached_blocks(self):
+        """
+        Her blok için (blok, tokens, başlangıç durumu, bitiş durumu). Token’lar BlockData’dan
+        okunur; vurgulanmamış ya da başka bir başlangıç durumuyla lex’lenmiş bloklar burada
+        lex’lenir.
+        """
+        state = STATE_NORMAL
+        block = self.document().firstBlock()
+        while block.isValid():
+            data = block.userData()
+            if isinstance(data, BlockData) and data.start_state == state:
+                tokens, end_state = data.tokens_for(block.text()), data.state
+            else:
+                tokens, end_state = tokenize_line(block.text(), state)
+            yield block, tokens, state, end_state
+            state = end_state
+            block = block.next()
+
+    def line_caches(self):
+        """
+        Her blok için (tokens, başlangıç durumu, bitiş durumu); anlık görüntü yazmak için.
+        """
+        for _, tokens, state, end_state in self._cached_blocks():
+            yield tokens, state, end_state
+
+    def line_tokens(self) -> List[LineTokens]:
+        """
+        Parser’a gönderilecek satırlar: her blok için (tokens, başlangıç durumu, blok konumu,
+        satır numarası). Token listelerinin yalnızca referansları toplanır; konumları kaydırıp
+        birleştirmek işçi thread’inin işidir (workspace.analyze).
+        """
+        return [(tokens, state, block.position(), number)
+                for number, (block, tokens, state, _) in enumerate(self._cached_blocks(), 1)]
+
+    def release_token_caches(self):
+        """
+        Blokların token listelerini bırakır (Workspace bellek bütçesi, arka plandaki sekmeler).
+        Durumlar, hatalar ve katlama bilgisi korunur; token’lar ilk kullanıldıklarında
+        (vurgulama, parantez indeksi, satır numarası alanı, line_tokens) yeniden lex’lenir.
+        """
+        block = self.document().firstBlock()
+        while block.isValid():
+            data = block.userData()
+            if isinstance(data, BlockData):
+                data.tokens = None
+            block = block.next()
+
+    def set_diagnostics(self, errors: List[Tuple[int, int, str]]):
+        """
+        Parser hatalarını ilgili blokların BlockData’sına yazar; satır numarası alanı
+        bu blokları işaretler.
+        """
+        doc = self.document()
+        for number in self._error_blocks:
+            data = doc.findBlockByNumber(number).userData()
+            if isinstance(data, BlockData):
+                data.errors = []
+        self._error_blocks = []
+        # Hatalar satır sırasında gelir; aynı satırdaki hatalar için blok bir kez aranır
+        last_line, data = None, None
+        for line, col, msg in errors:
+            if line != last_line:
+                last_line = line
+                data = doc.findBlockByNumber(line - 1).userData()
+                if isinstance(data, BlockData):
+                    self._error_blocks.append(line - 1)
+                else:
+                    data = None
+            if data is not None:
+                data.errors.append((col, msg))
+        self.line_number_area.update()
+
+    # -- Eş parantez ve katlama -----------------------------------------
+
+    def highlight_matching_bracket(self):
+        """
+        İmlecin yanındaki parantezi ve eşini vurgular. Yalnızca indekste ikili arama yapılır;
+        imleç hareketi belgeyi yeniden taramaz. Eşi olmayan parantez kırmızı gösterilir.
+        """
+        selections = []
+        found = self.brackets.match_at(self.textCursor().position())
+        if found is not None:
+            pos, other = found
+            color = QColor("#a0c4ff") if other >= 0 else QColor("#e08080")
+            for p in (pos, other):
+                if p < 0:
+                    continue
+                # Digraph’lar (<% %> <: :>) iki karakterdir
+                width = 1 if self.document().characterAt(p) in BRACKETS else 2
+                sel = QTextEdit.ExtraSelection()
+                sel.format.setBackground(color)
+                sel.cursor = QTextCursor(self.document())
+                sel.cursor.setPosition(p)
+                sel.cursor.setPosition(p + width, QTextCursor.KeepAnchor)
+                selections.append(sel)
+        self.setExtraSelections(selections)
+
+    def fold_region(self, block):
+        """
+        block’ta açılıp daha sonraki bir satırda kapanan ilk { … } bölgesinin kapanış bloğu.
+        Arada gizlenecek en az bir satır yoksa geçersiz blok döner.
+        """
+        regions = self.brackets.blocks_in(block.position(), block.position() + block.length())
+        if regions:
+            close = self.document().findBlock(regions[0][1])
+            if close.blockNumber() - block.blockNumber() >= 2:
+                return close
+        return self.document().findBlock(-1)
+
+    def toggle_fold(self, block):
+        """
+        block’ta başlayan bölgeyi katlar ya da açar. Açılış ve kapanış satırları görünür kalır,
+        aradaki satırlar gizlenir.
+        """
+        data = block.userData()
+        close = self.fold_region(block)
+        if not isinstance(data, BlockData) or not close.isValid():
+            return
+        data.folded = not data.folded
+        inner = block.next()
+        while inner.isValid() and inner != close:
+            inner.setVisible(not data.folded)
+            if not data.folded:
+                # İç içe katlanmış bölgeler açılırken kendi durumlarını korur
+                inner_data = inner.userData()
+                if isinstance(inner_data, BlockData) and inner_data.folded:
+                    inner_close = self.fold_region(inner)
+                    if inner_close.isValid():
+                        inner = inner_close
+                        continue
+            inner = inner.next()
+        self._relayout(block, close)
+
+    def unfold_all(self):
+        doc = self.document()
+        block = doc.firstBlock()
+        while block.isValid():
+            block.setVisible(True)
+            data = block.userData()
+            if isinstance(data, BlockData):
+                data.folded = False
+            block = block.next()
+        self._relayout(doc.firstBlock(), doc.lastBlock())
+
+    def _relayout(self, first, last):
+        """
+        Görünürlüğü değişen blokların yerleşimini yeniler. markContentsDirty bir
+        contentsChange üretir; _folding bayrağı bunun düzenleme sayılmasını engeller.
+        """
+        self._folding = True
+        try:
+            start = first.position()
+            self.document().markContentsDirty(start, last.position() + last.length() - start)
+        finally:
+            self._folding = False
+        block = first
+        while block.isValid():
+            data = block.userData()
+            if isinstance(data, BlockData):
+                data.fresh = False
+            if block == last:
+                break
+            block = block.next()
+        self.viewport().update()
+        self.line_number_area.update()
+
+    def go_to(self, line: int, column: int = 1):
+        """
+        İmleci verilen satır/kolona taşır (ör. outline listesinden). Hedef katlanmış bir
+        bölgedeyse bölgeler açılır.
+        """
+        block = self.document().findBlockByNumber(line - 1)
+        if not block.isValid():
+            return
+        if not block.isVisible():
+            self.unfold_all()
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + min(column - 1, block.length() - 1))
+        self.setTextCursor(cursor)
+        self.centerCursor()
+        self.setFocus()
+
+    # -- Satır numarası alanı -------------------------------------------
+
+    def line_number_area_width(self) -> int:
+        digits = len(str(max(1, self.blockCount())))
+        # Sağda katlama işareti (▾ / ▸) için bir karakterlik yer
+        return 10 + self.fontMetrics().horizontalAdvance("9") * (digits + 2)
+
+    def update_line_number_area_width(self, _=0):
+        self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
+
+    def update_line_number_area(self, rect: QRect, dy: int):
+        if dy:
+            self.line_number_area.scroll(0, dy)
+        else:
+            self.line_number_area.update(0, rect.y(), self.line_number_area.width(), rect.height())
+        if rect.contains(self.viewport().rect()):
+            self.update_line_number_area_width()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        cr = self.contentsRect()
+        self.line_number_area.setGeometry(QRect(cr.left(), cr.top(),
+                                                self.line_number_area_width(), cr.height()))
+
+    def line_number_area_paint_event(self, event):
+        """
+        Yalnızca görünür blokları dolaşır. Parser hatası veya UNKNOWN token içeren satırların
+        numarası kırmızı zemin üzerinde çizilir (bilgi doğrudan BlockData’dan okunur).
+        Katlanabilir satırlara parantez indeksinden bakılarak ▾ (açık) / ▸ (katlı) çizilir.
+        """
+        painter = QPainter(self.line_number_area)
+        painter.fillRect(event.rect(), QColor("#b4b4b4"))
+        marker = self.fontMetrics().horizontalAdvance("9")
+        width = self.line_number_area.width()
+        height = self.fontMetrics().height()
+
+        block = self.firstVisibleBlock()
+        top = round(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
+        bottom = top + round(self.blockBoundingRect(block).height())
+        while block.isValid() and top <= event.rect().bottom():
+            if block.isVisible() and bottom >= event.rect().top():
+                data = block.userData()
+                if isinstance(data, BlockData) and (data.errors or data.has_unknown(block.text())):
+                    painter.fillRect(0, top, width, height, QColor("#e08080"))
+                painter.setPen(QColor("black"))
+                painter.drawText(0, top, width - 5 - marker, height, Qt.AlignRight,
+                                 str(block.blockNumber() + 1))
+                if self.fold_region(block).isValid():
+                    folded = isinstance(data, BlockData) and data.folded
+                    painter.drawText(width - 3 - marker, top, marker, height, Qt.AlignCenter,
+                                     "▸" if folded else "▾")
+            block = block.next()
+            top = bottom
+            bottom = top + round(self.blockBoundingRect(block).height())
+
+    def block_at(self, y: int):
+        """
+        Satır numarası alanındaki y koordinatına denk gelen görünür blok.
+        """
+        block = self.firstVisibleBlock()
+        top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
+        while block.isValid():
+            bottom = top + self.blockBoundingRect(block).height()
+            if block.isVisible() and top <= y < bottom:
+                return block
+            block = block.next()
+            top = bottom
+        return block
@@ -0,0 +1,564 @@
+# lsp_server.py
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from parseTree import tokenize_line, LineTokens, Token, STATE_NORMAL
+from workspace import Workspace, WorkerPool, AnalysisResult
+
+# ----------------------------------------
+# LANGUAGE SERVER (LSP) — STDIO ÜZERİNDEN JSON-RPC
+# ----------------------------------------
+#
+# PyQt penceresi yerine başka editörlerden kullanılabilsin diye lexer ve parser’ı
+# Language Server Protocol ile sunar:
+#   - textDocument/didOpen, didChange (artımlı), didClose
+#   - textDocument/publishDiagnostics: Parser.parse() hataları
+#   - textDocument/semanticTokens/full: parseTree lexer’ından anlamsal token’lar
+#
+# Her belge, düzenleyicideki BlockData önbelleğinin karşılığı olarak satır satır tutulur:
+# satır metni, tokenize_line() çıktısı ve satır sonu durumu. Artımlı bir değişiklikte yalnızca
+# değişen satırlar ve satır sonu durumu değişmeye devam ettiği sürece sonrakiler yeniden
+# lex’lenir.
+#
+# Ana döngü asyncio’dur; parse işi Workspace’in WorkerPool’unda çalışır. Döngü yalnızca satır
+# listelerinin kopyasını (TextDocument.snapshot) gönderir; mutlak konumlu token listesi işçi
+# thread’inde kurulur, böylece döngü büyük belgelerde de mesaj okumayı bekletmez. Art arda gelen
+# değişiklikler debounce süresi boyunca birleştirilir, ayrıca havuz aynı belge için bekleyen
+# eski işi iptal eder. Belge değişince o belgeye ait bekleyen istekler ContentModified ile,
+# $/cancelRequest ile iptal edilenler RequestCancelled ile yanıtlanır.
+#
+# Kullanım:
+#   python lsp_server.py             → stdin/stdout üzerinden
+#   python lsp_server.py --tcp 2087  → yerel test istemcileri için TCP üzerinden
+
+# JSON-RPC / LSP hata kodları
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+SERVER_NOT_INITIALIZED = -32002
+REQUEST_CANCELLED = -32800
+CONTENT_MODIFIED = -32801
+
+# TextDocumentSyncKind.Incremental
+SYNC_INCREMENTAL = 2
+
+# DiagnosticSeverity.Error
+SEVERITY_ERROR = 1
+
+# Anlamsal token lejantı; parseTree token tipleri → lejanttaki indeks.
+# SEPARATOR ve UNKNOWN gönderilmez (istemcinin varsayılan rengi kullanılır).
+SEMANTIC_TOKEN_TYPES = ["keyword", "variable", "number", "string", "comment", "operator", "macro"]
+_SEMANTIC_INDEX = {
+    "KEYWORD": 0,
+    "IDENTIFIER": 1,
+    "NUMBER": 2,
+    "HEXNUMBER": 2,
+    "STRING_LITERAL": 3,
+    "CHAR_LITERAL": 3,
+    "COMMENT1": 4,
+    "COMMENT2": 4,
+    "OP": 5,
+    "PREPROCESSOR": 6,
+}
+
+DEFAULT_DEBOUNCE = 0.15     # Diagnostic üretmeden önce beklenen sessizlik süresi (saniye)
+
+
+def _utf16_len(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _utf16_to_index(text: str, units: int) -> int:
+    """
+    LSP’nin UTF-16 kod birimi cinsinden kolonunu Python string indeksine çevirir.
+    """
+    if text.isascii():
+        return min(units, len(text))
+    count = 0
+    for i, ch in enumerate(text):
+        if count >= units:
+            return i
+        count += 2 if ord(ch) > 0xFFFF else 1
+    return len(text)
+
+
+def _index_to_utf16(text: str, index: int) -> int:
+    if text.isascii():
+        return index
+    return _utf16_len(text[:index])
+
+
+class TextDocument:
+    """
+    Sunucudaki tek bir belge. lines, tokens ve states paralel listelerdir:
+    - lines:  Satır metinleri (newline ve sondaki \\r olmadan).
+    - tokens: tokenize_line() çıktısı (konumlar satır başına göre).
+    - states: Satır sonundaki lexer durumu; sonraki satırın başlangıç durumu.
+    """
+
+    def __init__(self, uri: str, version: int, text: str):
+        self.uri = uri
+        self.version = version
+        self.lines: List[str] = _split_lines(text)
+        self.tokens: List[Optional[List[Token]]] = [None] * len(self.lines)
+        self.states: List[Optional[int]] = [None] * len(self.lines)
+        self.relexed = 0        # Son değişiklikte yeniden lex’lenen satır sayısı
+        self._relex(0, len(self.lines))
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def apply_change(self, change: dict):
+        """
+        Tek bir TextDocumentContentChangeEvent uygular. range yoksa belgenin tamamı değişir.
+        """
+        if "range" not in change:
+            self.lines = _split_lines(change["text"])
+            self.tokens = [None] * len(self.lines)
+            self.states = [None] * len(self.lines)
+            self._relex(0, len(self.lines))
+            return
+
+        start, end = change["range"]["start"], change["range"]["end"]
+        last = len(self.lines) - 1
+        sl, el = min(start["line"], last), min(end["line"], last)
+        sc = _utf16_to_index(self.lines[sl], start["character"]) if start["line"] <= last else len(self.lines[sl])
+        ec = _utf16_to_index(self.lines[el], end["character"]) if end["line"] <= last else len(self.lines[el])
+
+        new_lines = _split_lines(self.lines[sl][:sc] + change["text"] + self.lines[el][ec:])
+        count = len(new_lines)
+        # Değişen aralığın son satırı eski bitiş durumunu korur: yeni son satır aynı durumda
+        # biterse sonraki satırlar geçerlidir ve lex orada durur
+        old_end = self.states[el]
+        self.lines[sl:el + 1] = new_lines
+        self.tokens[sl:el + 1] = [None] * count
+        self.states[sl:el + 1] = [None] * (count - 1) + [old_end]
+        self._relex(sl, sl + count)
+
+    def _relex(self, first: int, changed_end: int):
+        """
+        first satırından başlayarak yeniden lex’ler. changed_end’e ulaşıldıktan sonra (değişen
+        aralığın son satırı dahil), yeni satır sonu durumu önbellektekiyle aynı olduğu anda
+        durulur (sonraki satırlar aynı başlangıç durumuyla lex’lenmiş, geçerli kalır).
+        """
+        state = self.states[first - 1] if first > 0 else STATE_NORMAL
+        i = first
+        while i < len(self.lines):
+            tokens, end_state = tokenize_line(self.lines[i], state)
+            old_state = self.states[i]
+            self.tokens[i] = tokens
+            self.states[i] = end_state
+            i += 1
+            if i >= changed_end and old_state == end_state:
+                break
+            state = end_state
+        self.relexed = i - first
+
+    def snapshot(self) -> "DocumentSnapshot":
+        """
+        İşçi thread’inde kullanılmak üzere belgenin şimdiki sürümü (bkz. DocumentSnapshot).
+        """
+        return DocumentSnapshot(self.lines, self.tokens, self.states)
+
+
+class DocumentSnapshot:
+    """
+    TextDocument’ın satır, token ve durum listelerinin kopyası. Yalnızca listeler kopyalanır:
+    TextDocument satırların token listelerini yerinde değiştirmez, yenileriyle değiştirir.
+    Üzerinde dolaşmak parser’a verilecek satırları (tokens, başlangıç durumu, konum, satır
+    numarası) üretir; Workspace bunları işçi thread’inde join_line_tokens ile birleştirir.
+    """
+    __slots__ = ("lines", "tokens", "states")
+
+    def __init__(self, lines: List[str], tokens: List[List[Token]], states: List[int]):
+        self.lines = list(lines)
+        self.tokens = list(tokens)
+        self.states = list(states)
+
+    def __iter__(self) -> Iterator[LineTokens]:
+        state = STATE_NORMAL
+        position = 0
+        for number, (line, tokens, end_state) in enumerate(zip(self.lines, self.tokens, self.states), 1):
+            yield tokens, state, position, number
+            state = end_state
+            position += len(line) + 1
+
+
+def _split_lines(text: str) -> List[str]:
+    return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+
+def semantic_tokens(lines: List[str], tokens: List[List[Token]]) -> List[int]:
+    """
+    Satır token’larını LSP’nin göreli kodlamasına çevirir:
+    (deltaLine, deltaStartChar, length, tokenType, tokenModifiers) beşlileri.
+    Satırlara bölünmüş yorum/direktif parçaları ayrı token olarak gönderilir.
+    """
+    data: List[int] = []
+    prev_line = 0
+    prev_start = 0
+    for number, (text, line_tokens) in enumerate(zip(lines, tokens)):
+        ascii_line = text.isascii()
+        for tok in line_tokens:
+            kind = _SEMANTIC_INDEX.get(tok.type)
+            if kind is None or not tok.value:
+                continue
+            if ascii_line:
+                start, length = tok.position, len(tok.value)
+            else:
+                start = _index_to_utf16(text, tok.position)
+                length = _utf16_len(tok.value)
+            if number != prev_line:
+                prev_start = 0
+            data += (number - prev_line, start - prev_start, length, kind, 0)
+            prev_line = number
+            prev_start = start
+    return data
+
+
+def diagnostics(doc_lines: List[str], errors: List[Tuple[int, int, str]]) -> List[dict]:
+    """
+    Parser hatalarını (1 tabanlı satır, kolon) LSP Diagnostic nesnelerine çevirir.
+    """
+    result = []
+    last = len(doc_lines) - 1
+    for line, col, msg in errors:
+        number = min(max(line - 1, 0), last)
+        text = doc_lines[number]
+        character = _index_to_utf16(text, min(max(col - 1, 0), len(text)))
+        pos = {"line": number, "character": character}
+        result.append({"range": {"start": pos, "end": pos},
+                       "severity": SEVERITY_ERROR,
+                       "source": "c-syntax",
+                       "message": msg})
+    return result
+
+
+class RequestError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[dict]:
+    """
+    Content-Length başlıklı tek bir JSON-RPC mesajı okur; akış bittiyse None döner.
+    """
+    length = None
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        raise RequestError(INVALID_REQUEST, "Missing Content-Length header")
+    body = await reader.readexactly(length)
+    return json.loads(body.decode("utf-8"))
+
+
+def encode_message(message: dict) -> bytes:
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+class LanguageServer:
+    """
+    Tek bir istemci bağlantısına hizmet eden sunucu. serve() okuma döngüsünü çalıştırır;
+    herhangi bir asyncio StreamReader/StreamWriter çiftiyle (stdio, TCP, test istemcisi)
+    kullanılabilir.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 workspace: Optional[Workspace] = None, debounce: float = DEFAULT_DEBOUNCE):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.documents: Dict[str, TextDocument] = {}
+        self.initialized = False
+        self.shutdown_requested = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._own_workspace = workspace is None
+        self.workspace = workspace if workspace is not None else Workspace(WorkerPool(workers=1))
+        self.workspace.on_result = self._on_result
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._submitted: Dict[str, int] = {}            # uri → parse’a gönderilen LSP sürümü
+        self._requests: Dict[object, asyncio.Task] = {}
+        self._doc_requests: Dict[str, Set[object]] = {}  # uri → bekleyen istek id’leri
+        self._cancel_codes: Dict[object, int] = {}       # iptal edilen istek → hata kodu
+
+    # -- Okuma döngüsü --------------------------------------------------
+
+    async def serve(self) -> int:
+        """
+        exit bildirimi gelene ya da akış kapanana kadar mesajları işler. Çıkış kodunu döner
+        (shutdown isteği alınmışsa 0, aksi halde 1).
+        """
+        self._loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    message = await read_message(self.reader)
+                except (ValueError, RequestError) as exc:
+                    self._send({"jsonrpc": "2.0", "id": None,
+                                "error": {"code": PARSE_ERROR, "message": str(exc)}})
+                    continue
+                except asyncio.IncompleteReadError:
+                    break
+                if message is None or message.get("method") == "exit":
+                    break
+                self._dispatch(message)
+        finally:
+            for timer in self._timers.values():
+                timer.cancel()
+            for task in self._requests.values():
+                task.cancel()
+            if self._own_workspace:
+                self.workspace.shutdown()
+        return 0 if self.shutdown_requested else 1
+
+    def _dispatch(self, message: dict):
+        method = message.get("method")
+        if method is None:
+            return     # İstemciden gelen yanıtlar (sunucu istek göndermiyor)
+        params = message.get("params") or {}
+        if "id" not in message:
+            handler = self.NOTIFICATIONS.get(method)
+            if handler is not None and (self.initialized or method == "initialized"):
+                handler(self, params)
+            return
+
+        request_id = message["id"]
+        handler = self.REQUESTS.get(method)
+        if handler is None:
+            self._reply_error(request_id, METHOD_NOT_FOUND, f"Unknown method '{method}'")
+            return
+        if not self.initialized and method != "initialize":
+            self._reply_error(request_id, SERVER_NOT_INITIALIZED, "Server not initialized")
+            return
+        task = self._loop.create_task(handler(self, params))
+        self._requests[request_id] = task
+        uri = params.get("textDocument", {}).get("uri")
+        if uri is not None:
+            self._doc_requests.setdefault(uri, set()).add(request_id)
+        task.add_done_callback(lambda t: self._finish(request_id, uri, t))
+
+    def _finish(self, request_id, uri: Optional[str], task: asyncio.Task):
+        self._requests.pop(request_id, None)
+        if uri is not None:
+            self._doc_requests.get(uri, set()).discard(request_id)
+        code = self._cancel_codes.pop(request_id, REQUEST_CANCELLED)
+        if task.cancelled():
+            if code == CONTENT_MODIFIED:
+                self._reply_error(request_id, CONTENT_MODIFIED, "Content modified")
+            else:
+                self._reply_error(request_id, REQUEST_CANCELLED, "Request cancelled")
+            return
+        exc = task.exception()
+        if isinstance(exc, RequestError):
+            self._reply_error(request_id, exc.code, exc.message)
+        elif exc is not None:
+            self._reply_error(request_id, INVALID_REQUEST, f"{type(exc).__name__}: {exc}")
+        else:
+            self._send({"jsonrpc": "2.0", "id": request_id, "result": task.result()})
+
+    # -- Yazma ----------------------------------------------------------
+
+    def _send(self, message: dict):
+        # Mesaj tek write() ile yazılır; eşzamanlı yanıtlar birbirine karışmaz
+        if not self.writer.is_closing():
+            self.writer.write(encode_message(message))
+
+    def _reply_error(self, request_id, code: int, message: str):
+        self._send({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}})
+
+    def _notify(self, method: str, params: dict):
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    # -- İstekler -------------------------------------------------------
+
+    async def _initialize(self, params: dict) -> dict:
+        self.initialized = True
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": SYNC_INCREMENTAL},
+                "semanticTokensProvider": {
+                    "legend": {"tokenTypes": SEMANTIC_TOKEN_TYPES, "tokenModifiers": []},
+                    "full": True,
+                },
+            },
+            "serverInfo": {"name": "c-syntax-highlighter"},
+        }
+
+    async def _shutdown(self, params: dict):
+        self.shutdown_requested = True
+        return None
+
+    async def _semantic_tokens_full(self, params: dict) -> dict:
+        """
+        Anlamsal token’lar satır önbelleğinden kodlanır. Kodlama işçi thread’inde yapılır;
+        bu sırada belge değişirse sonuç eski sürüme ait olacağından istek ContentModified
+        ile iptal edilir (_cancel_document_requests).
+        """
+        snapshot = self._document(params).snapshot()
+        data = await self._loop.run_in_executor(None, semantic_tokens, snapshot.lines, snapshot.tokens)
+        return {"data": data}
+
+    def _document(self, params: dict) -> TextDocument:
+        uri = params["textDocument"]["uri"]
+        doc = self.documents.get(uri)
+        if doc is None:
+            raise RequestError(INVALID_REQUEST, f"Document not open: {uri}")
+        return doc
+
+    # -- Bildirimler ----------------------------------------------------
+
+    def _initialized(self, params: dict):
+        pass
+
+    def _did_open(self, params: dict):
+        item = params["textDocument"]
+        doc = TextDocument(item["uri"], item.get("version", 0), item["text"])
+        self.documents[doc.uri] = doc
+        self._submitted[doc.uri] = doc.version
+        self.workspace.open(doc.uri, doc.snapshot())
+        self.workspace.activate(doc.uri)
+
+    def _did_change(self, params: dict):
+        uri = params["textDocument"]["uri"]
+        doc = self.documents.get(uri)
+        if doc is None:
+            return
+        for change in params["contentChanges"]:
+            doc.apply_change(change)
+        doc.version = params["textDocument"].get("version", doc.version + 1)
+        self._cancel_document_requests(uri)
+        self.workspace.activate(uri)
+        self._schedule_parse(uri)
+
+    def _did_close(self, params: dict):
+        uri = params["textDocument"]["uri"]
+        self._cancel_document_requests(uri)
+        timer = self._timers.pop(uri, None)
+        if timer is not None:
+            timer.cancel()
+        if self.documents.pop(uri, None) is not None:
+            self.workspace.close(uri)
+            self._submitted.pop(uri, None)
+            self._notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    def _cancel_request(self, params: dict):
+        self._cancel(params.get("id"), REQUEST_CANCELLED)
+
+    # -- Parse zamanlaması ----------------------------------------------
+
+    def _schedule_parse(self, uri: str):
+        """
+        Debounce: her değişiklik zamanlayıcıyı yeniden kurar; parse yalnızca değişiklikler
+        debounce süresi boyunca durduğunda kuyruğa girer.
+        """
+        timer = self._timers.pop(uri, None)
+        if timer is not None:
+            timer.cancel()
+        self._timers[uri] = self._loop.call_later(self.debounce, self._submit_parse, uri)
+
+    def _submit_parse(self, uri: str):
+        self._timers.pop(uri, None)
+        doc = self.documents.get(uri)
+        if doc is None:
+            return
+        self._submitted[uri] = doc.version
+        self.workspace.update(uri, doc.snapshot())
+
+    def _on_result(self, uri: str, result: AnalysisResult):
+        # İşçi thread’inden çağrılır; yayın ana döngüde yapılır
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._publish, uri, result)
+
+    def _publish(self, uri: str, result: AnalysisResult):
+        doc = self.documents.get(uri)
+        if doc is None:
+            return
+        self._notify("textDocument/publishDiagnostics", {
+            "uri": uri,
+            "version": self._submitted.get(uri, doc.version),
+            "diagnostics": diagnostics(doc.lines, result.errors),
+        })
+
+    def _cancel_document_requests(self, uri: str):
+        for request_id in list(self._doc_requests.get(uri, ())):
+            self._cancel(request_id, CONTENT_MODIFIED)
+
+    def _cancel(self, request_id, code: int):
+        """
+        Bekleyen isteği iptal eder. Yanıttaki hata kodu ilk iptal nedenine göre belirlenir.
+        """
+        task = self._requests.get(request_id)
+        if task is not None and not task.done():
+            self._cancel_codes.setdefault(request_id, code)
+            task.cancel()
+
+    REQUESTS = {
+        "initialize": _initialize,
+        "shutdown": _shutdown,
+        "textDocument/semanticTokens/full": _semantic_tokens_full,
+    }
+
+    NOTIFICATIONS = {
+        "initialized": _initialized,
+        "textDocument/didOpen": _did_open,
+        "textDocument/didChange": _did_change,
+        "textDocument/didClose": _did_close,
+        "$/cancelRequest": _cancel_request,
+    }
+
+
+async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, **kwargs) -> int:
+    """
+    Verilen akış çifti üzerinde bir LanguageServer çalıştırır ve çıkış kodunu döner.
+    """
+    server = LanguageServer(reader, writer, **kwargs)
+    try:
+        return await server.serve()
+    finally:
+        writer.close()
+
+
+async def _serve_stdio() -> int:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout.buffer)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return await serve(reader, writer)
+
+
+async def _serve_tcp(port: int):
+    server = await asyncio.start_server(serve, "127.0.0.1", port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="C syntax language server (LSP over stdio).")
+    ap.add_argument("--tcp", type=int, metavar="PORT", help="listen on 127.0.0.1:PORT instead of stdio")
+    args = ap.parse_args(argv)
+    if args.tcp:
+        asyncio.run(_serve_tcp(args.tcp))
+    else:
+        sys.exit(asyncio.run(_serve_stdio()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
+import sys
+
 from PyQt5.QtWidgets import QApplication
 from CLanguageSyntaxHighlighter import Highlighter
 
 # QApplication: PyQt5 uygulamasının ana nesnesi
-app = QApplication([])
+app = QApplication(sys.argv)
 
 # Highlighter sınıfımızı oluştur, pencereyi göster
 win = Highlighter()
+
+# Komut satırında verilen dosyalar ayrı sekmelerde açılır
+for path in sys.argv[1:]:
+    win.open_file(path)
+
 win.show()
 
 # Uygulama döngüsünü başlat (ui canlı kalır)
@@ -1,7 +1,7 @@
 # parseTree.py
 
 import re
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # ----------------------------------------
 # 1. TOKENIZER (LEXER) BÖLÜMÜ
@@ -11,51 +11,98 @@ from typing import List, Tuple
 # uygulanır. Yani, regex’ler bir tablo (TOKEN_SPECIFICATION) içinde tanımlanmış, ve
 # aynı anda tüm bu desenler birleştirilerek _TOKEN_REGEX altında tek bir regex oluşturulmuştur.
 # Ardından metin bu birleşik desenlere göre taranır; bulunan her eşleşme bir Token nesnesine dönüştürülür.
+# Tablonun üçüncü sütunu token tipinin vurgu stilidir; CSyntaxHighlighter ve diğer
+# renklendiriciler renkleri buradan okur, böylece lexer ile vurgulayıcı aynı tabloyu kullanır.
 #
-# Token tipleri:
-#   - PREPROCESSOR:   Satır başında # ile başlayan satırlar (örneğin #include, #define).
+# Token tipleri (C11 sözcük grameri):
+#   - PREPROCESSOR:   Satır başında # (ya da digraph karşılığı %:) ile başlayan satırlar (örneğin
+#                     #include, %:define); satır sonundaki “\” ile sonraki satırlara devam edebilir.
 #   - COMMENT1:       // ile başlayan tek satırlık yorumlar.
-#   - COMMENT2_START: /* ile başlayan çok satırlı yorum başlangıcı (bitene kadar toplanacak).
-#   - COMMENT2_END:   */ ile biten çok satırlı yorumun sonu.
-#   - STRING_LITERAL: Çift tırnak içinde, escape karakterleri destekleyen string.
-#   - CHAR_LITERAL:   Tek tırnak içinde, escape karakterleri destekleyen char literal.
-#   - KEYWORD:        C dilindeki anahtar sözcükler (int, char, void, if, else, while, for, return, struct, union, typedef).
-#   - NUMBER:         Ondalık sayılar (tam sayı veya float gösterimi).
-#   - HEXNUMBER:      Onaltılık sayılar (0x... biçiminde).
+#   - COMMENT2:       /* ile başlayan çok satırlı yorum (“*/” kapanışına kadar toplanır).
+#   - COMMENT2_END:   Yorum dışında kalmış “*/”.
+#   - STRING_LITERAL: Çift tırnak içinde, escape karakterleri destekleyen string (u8, u, U, L önekleriyle).
+#   - CHAR_LITERAL:   Tek tırnak içinde, escape karakterleri destekleyen char literal (u, U, L önekleriyle).
+#   - HEXNUMBER:      Onaltılık tam sayılar (0x1F, 0xFFu) ve onaltılık kayan noktalılar (0x1.8p3).
+#   - NUMBER:         Ondalık/sekizlik tam sayılar (10UL, 017) ve kayan noktalı sayılar (1.5, .5f, 1e-3L).
+#   - KEYWORD:        KEYWORDS kümesindeki C11 anahtar sözcükleri (IDENTIFIER eşleşmesinden ayrılır).
 #   - IDENTIFIER:     Değişken veya fonksiyon isimleri: harf veya _ ile başlayıp harf/num/arac bulundurabilir.
-#   - OP:             Operatörler: ==, !=, <=, >=, ++, --, +=, -=, *=, /=, &&, ||, <<, >>, ->, ya da tek karakterli + - * / % < > & ^ | = ~ ! ? :
-#   - SEPARATOR:      Ayraçlar: ; , ( ) { } [ ]
-#   - SKIP:           Boşluk, tab, newline; bu token’lar atlanır.
+#   - OP:             Operatörler: ..., <<=, >>=, ->, ++, --, <<, >>, <=, >=, ==, !=, &&, ||, birleşik atamalar
+#                     (*= /= %= += -= &= ^= |=) ya da tek karakterli + - * / % < > & ^ | = ~ ! ? : .
+#                     Satır içindeki %:%: ve %: (## ve # digraph’ları) da OP olur.
+#   - SEPARATOR:      Ayraçlar: ; , ( ) { } [ ] ve digraph karşılıkları <: :> <% %>
+#   - SKIP:           Newline ve boş satırlar; bu token’lar atlanır (satır içi boşluklar her token’ın
+#                     önünde zaten atlanır).
 #   - MISMATCH:       Yukarıdakilerle eşleşmeyen diğer karakterler; UNKNOWN olarak işaretlenir.
 #
-# Çok satırlı yorumlar (COMMENT2_START) bulununca “*/” kapanışına kadar devam eden metin tek bir
+# Çok satırlı yorumlar (COMMENT2) bulununca “*/” kapanışına kadar devam eden metin tek bir
 # COMMENT2 token’ı olarak eklenir. Eğer kapanış yoksa, kalan tüm metin yorum sayılır.
 
-
-TOKEN_SPECIFICATION: List[Tuple[str, str]] = [
-    ("PREPROCESSOR",     r"^\s*#.*"),                        # Satır başında # içeren direktifler
-    ("COMMENT1",         r"//[^\n]*"),                       # // ile başlayan tek satırlık yorum
-    ("COMMENT2_START",   r"/\*"),                            # /* ile başlayan çok satırlı yorum başlangıcı
-    ("COMMENT2_END",     r"\*/"),                            # Çok satırlı yorumun bitişi (kod içinde yakalanacak)
-    ("STRING_LITERAL",   r"\"(?:\\.|[^\"\\])*\""),           # Çift tırnak içinde, escape dizilerini destekler
-    ("CHAR_LITERAL",     r"'(?:\\.|[^'\\])*'"),              # Tek tırnak içinde, escape dizilerini destekler
-    ("KEYWORD",          r"\b(?:int|char|void|if|else|while|for|return|struct|union|typedef)\b"),
-    ("NUMBER",           r"\b[0-9]+(?:\.[0-9]*)?(?:[eE][+-]?[0-9]+)?\b"),  # Ondalık tam sayılar ve float
-    ("HEXNUMBER",        r"\b0[xX][0-9A-Fa-f]+\b"),          # Onaltılık sayılar (0x...)
-    ("IDENTIFIER",       r"\b[A-Za-z_][A-Za-z0-9_]*\b"),     # Geçerli C değişken/fonksiyon ismi
-    ("OP",               r"==|!=|<=|>=|\+\+|--|\+=|-=|\*=|/=|&&|\|\||<<|>>|->|"
-                         r"[+\-*/%<>&\^|=~!?:]"),           # Çok ve tek karakterli operatörler
-    ("SEPARATOR",        r"[;,()\[\]\{\}]"),                 # ; , ( ) { } [ ]
-    ("SKIP",             r"[ \t\r\n]+"),                     # Boşluk, tab, satır başı: ignore edilecek
-    ("MISMATCH",         r"."),                              # Diğer karakterler (bilinmeyen)
+KEYWORDS = frozenset((
+    "auto", "break", "case", "char", "const", "continue", "default", "do", "double",
+    "else", "enum", "extern", "float", "for", "goto", "if", "inline", "int", "long",
+    "register", "restrict", "return", "short", "signed", "sizeof", "static", "struct",
+    "switch", "typedef", "union", "unsigned", "void", "volatile", "while",
+    "_Alignas", "_Alignof", "_Atomic", "_Bool", "_Complex", "_Generic", "_Imaginary",
+    "_Noreturn", "_Static_assert", "_Thread_local",
+))
+
+# Vurgu stili: (renk, kalın, italik); None → renklendirilmez
+TokenStyle = Tuple[str, bool, bool]
+
+_COMMENT_STYLE: TokenStyle = ("#006400", False, True)       # koyu yeşil italik
+_LITERAL_STYLE: TokenStyle = ("magenta", False, False)
+_NUMBER_STYLE: TokenStyle = ("blue", False, False)
+_PUNCT_STYLE: TokenStyle = ("#8B4500", False, False)        # koyu turuncu
+
+# Sıra önemlidir: birleşik regex’te ilk eşleşen alternatif kazanır.
+TOKEN_SPECIFICATION: List[Tuple[str, Optional[str], Optional[TokenStyle]]] = [
+    ("PREPROCESSOR",     r"(?:#|%:)(?:\\\r?\n|[^\n])*",
+                         ("#000080", False, False)),         # Satır başında # / %: içeren direktifler (\ ile devam)
+    ("COMMENT1",         r"//[^\n]*", _COMMENT_STYLE),      # // ile başlayan tek satırlık yorum
+    ("COMMENT2",         r"/\*", _COMMENT_STYLE),            # /* ile başlayan çok satırlı yorum başlangıcı
+    ("COMMENT2_END",     r"\*/", None),                     # Yorum dışında kalmış çok satırlı yorum bitişi
+    ("STRING_LITERAL",   r"(?:u8|[uUL])?\"(?:\\.|[^\"\\\n])*\"",
+                         _LITERAL_STYLE),                    # Çift tırnak içinde, escape dizilerini destekler (satır aşmaz)
+    ("CHAR_LITERAL",     r"[uUL]?'(?:\\.|[^'\\\n])*'",
+                         _LITERAL_STYLE),                    # Tek tırnak içinde, escape dizilerini destekler (satır aşmaz)
+    ("HEXNUMBER",        r"0[xX](?:[0-9A-Fa-f]*\.[0-9A-Fa-f]+|[0-9A-Fa-f]+\.?)[pP][+-]?[0-9]+[fFlL]?"
+                         r"|0[xX][0-9A-Fa-f]+(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?",
+                         _NUMBER_STYLE),                     # Onaltılık kayan noktalı ve tam sayılar (0x...)
+    ("NUMBER",           r"(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?[fFlL]?"
+                         r"|[0-9]+[eE][+-]?[0-9]+[fFlL]?"
+                         r"|[0-9]+(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)?",
+                         _NUMBER_STYLE),                     # Kayan noktalı sayılar ve ondalık/sekizlik tam sayılar
+    ("KEYWORD",          None, ("red", True, False)),       # IDENTIFIER eşleşmesi KEYWORDS içindeyse
+    ("IDENTIFIER",       r"[^\W\d]\w*", ("black", False, False)),  # Geçerli C değişken/fonksiyon ismi
+    ("SEPARATOR",        r"<:|:>|<%|%>|[;,()\[\]{}]", _PUNCT_STYLE),   # ; , ( ) { } [ ] ve digraph’lar
+    ("OP",               r"%:%:|%:|\.\.\.|<<=|>>=|->|\+\+|--|<<|>>|<=|>=|==|!=|&&|\|\||"
+                         r"[*/%+\-&^|]=|[+\-*/%<>&^|=~!?:.]",
+                         _PUNCT_STYLE),                      # Çok ve tek karakterli operatörler
+    ("SKIP",             r"\n(?:[ \t\r\f\v]*\n)*", None),    # Satır sonu ve boş satırlar: ignore edilecek
+    ("MISMATCH",         r"[^ \t\r\f\v\n]", None),           # Diğer karakterler (bilinmeyen)
 ]
 
-# Yukarıdaki desenleri tek bir regex’e dönüştürüyoruz.
+# Token tipi → vurgu stili (lexer’ın ürettiği tipler için; MISMATCH → UNKNOWN)
+TOKEN_STYLES: Dict[str, TokenStyle] = {
+    name: style for name, _, style in TOKEN_SPECIFICATION if style is not None
+}
+
+# Yukarıdaki desenleri tek bir regex’e dönüştürüyoruz (desensiz satırlar, ör. KEYWORD, atlanır).
+# Satır içi boşluklar ayrı bir SKIP eşleşmesi üretmek yerine her token’ın önünde atlanır
+# (_HSPACE); böylece tarama döngüsü boşluk başına bir tur daha dönmez. PREPROCESSOR yalnızca
+# satır başında (girintiden sonra) geçerli olduğu için ^ ile ayrı bir alternatif olarak eklenir.
+_HSPACE = r"[ \t\r\f\v]*"
 _TOKEN_REGEX = re.compile(
-    "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPECIFICATION),
+    f"^{_HSPACE}(?P<PREPROCESSOR>{TOKEN_SPECIFICATION[0][1]})|{_HSPACE}(?:"
+    + "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in TOKEN_SPECIFICATION[1:]
+               if pattern is not None)
+    + ")",
     re.MULTILINE
 )
 
+# Önceki satırdan devam eden bir direktifin satır içindeki kısmı
+_PREPROCESSOR_CONTINUATION = re.compile(r"(?:\\\r?\n|[^\n])*")
+
 
 class Token:
     """
@@ -87,73 +134,163 @@ def tokenize(code: str) -> List[Token]:
     - SKIP token’ları (boşluk, tab, newline) atlanıyor.
     - MISMATCH durumunda, bilinmeyen karakterler “UNKNOWN” türü ile tokenize ediliyor.
     """
+    return _scan(code, 0)
+
+
+def _scan(code: str, pos: int) -> List[Token]:
+    """
+    tokenize() ve tokenize_line() için ortak tarama döngüsü; code içinde pos indeksinden
+    itibaren token üretir. Pozisyonlar ve kolonlar code’un başına göre hesaplanır.
+    """
     tokens: List[Token] = []
+    append = tokens.append            # Sıcak döngüde öznitelik aramasını önlemek için
+    match = _TOKEN_REGEX.match
+    keywords = KEYWORDS
     line_num = 1           # Başlangıçta satır numarası 1
     line_start = 0         # O satırın karakter bazlı başlangıç indeksi
-
-    it = _TOKEN_REGEX.finditer(code)
-    idx_iter = iter(it)    # Çok satırlı yorum atlama işlemi için iterator’ı kontrol ediyoruz
-    for mo in idx_iter:
+    end_pos = len(code)
+
+    while pos < end_pos:
+        # MISMATCH (.) ve SKIP (newline) sayesinde, metin sonundaki boşluklar dışında
+        # her konumda bir eşleşme vardır
+        mo = match(code, pos)
+        if mo is None:
+            break
         kind = mo.lastgroup       # Hangi grup (token türü) yakalandı
-        value = mo.group(kind)    # Eşleşen dizge
-        start_pos = mo.start()    # Metindeki başlangıç indeksi
+        pos = mo.end()
 
         if kind == "SKIP":
-            # SKIP token: yalnızca newline içeriyorsa satır numarasını güncelle
-            newlines = value.count("\n")
-            if newlines:
-                line_num += newlines
-                # Son newline’dan sonraki metin satır başı kabul edilir
-                line_start = mo.end() - (value.rfind("\n") + 1)
+            # SKIP token: satır numarasını güncelle; desen newline ile biter,
+            # bu yüzden sonraki satır pos’ta başlar
+            line_num += mo.group(kind).count("\n")
+            line_start = pos
             continue  # Yeni token okumaya devam et
 
-        # Çok satırlı yorum, COMMENT2_START olarak eşleştiğinde:
-        if kind == "COMMENT2_START":
-            # Kalan metin içinde '*/' desenini arıyoruz
-            rest = code[mo.end():]
-            end_match = re.search(r"\*/", rest)
-            if end_match:
-                # Yorum bloğunun tam metnini al
-                comment_text = code[mo.start(): mo.end() + end_match.end()]
-                # Yorum bloğunda newline varsa satır numarasını güncelle
-                inner = code[mo.end(): mo.end() + end_match.end()]
-                ln = inner.count("\n")
-                if ln:
-                    line_num += ln
-                    line_start = mo.end() + end_match.end() - (inner.rfind("\n") + 1)
-                # Tek bir COMMENT2 token olarak ekle
-                tokens.append(Token("COMMENT2", comment_text, mo.start(),
-                                    line_num, mo.start() - line_start + 1))
-                # ‘finditer’ akışını yorum bloğu sonuna atlamak için iterator’ı ilerlet
-                for _ in range(end_match.end()):
-                    next(idx_iter, None)
-                continue
-            else:
-                # Eğer kapanış bulunmazsa, bütün kalan kod yorum sayılır
-                comment_text = code[mo.start():]
-                tokens.append(Token("COMMENT2", comment_text, mo.start(),
-                                    line_num, mo.start() - line_start + 1))
-                break  # Artık kodun geri kalanını işlemeye gerek yok
-
+        start_pos = mo.start(kind)    # Metindeki başlangıç indeksi (önündeki boşluklar hariç)
+
+        if kind == "IDENTIFIER":
+            value = code[start_pos:pos]
+            append(Token("KEYWORD" if value in keywords else "IDENTIFIER", value, start_pos,
+                         line_num, start_pos - line_start + 1))
+            continue
+
+        # Çok satırlı yorum, COMMENT2 olarak eşleştiğinde:
+        if kind == "COMMENT2":
+            # Kalan metin içinde '*/' desenini arıyoruz (kopya oluşturmadan)
+            close = code.find("*/", pos)
+            # Eğer kapanış bulunmazsa, bütün kalan kod yorum sayılır
+            pos = close + 2 if close >= 0 else end_pos
+            comment_text = code[start_pos:pos]
+            # Tek bir COMMENT2 token olarak ekle
+            append(Token("COMMENT2", comment_text, start_pos,
+                         line_num, start_pos - line_start + 1))
+            # Yorum bloğunda newline varsa satır numarasını güncelle
+            ln = comment_text.count("\n")
+            if ln:
+                line_num += ln
+                line_start = start_pos + comment_text.rfind("\n") + 1
+            continue
+
+        value = mo.group(kind)
         # MISMATCH: tanımsız karakterler “UNKNOWN” olarak tokenize edilir
-        if kind == "MISMATCH":
-            tokens.append(Token("UNKNOWN", value, start_pos,
-                                line_num, start_pos - line_start + 1))
-        else:
-            # Diğer türler normal olarak eklenir
-            tokens.append(Token(kind, value, start_pos,
-                                line_num, start_pos - line_start + 1))
-
-        # Eğer value içerisinde newline varsa, satır numarasını güncelle
-        if "\n" in value:
-            newlines = value.count("\n")
-            line_num += newlines
+        append(Token("UNKNOWN" if kind == "MISMATCH" else kind, value, start_pos,
+                     line_num, start_pos - line_start + 1))
+
+        # “\” ile devam eden direktifler newline içerebilir; satır numarasını güncelle
+        if kind == "PREPROCESSOR" and "\n" in value:
+            line_num += value.count("\n")
             # Son newline’dan sonraki metin satır başlangıcı kabul edilir
-            line_start = mo.end() - (value.rfind("\n") + 1)
+            line_start = start_pos + value.rfind("\n") + 1
 
     return tokens
 
 
+# Satır bazlı (artımlı) lexer durumları:
+#   - STATE_NORMAL:       Satır normal kod olarak başlar.
+#   - STATE_COMMENT:      Satır, önceki satırda açılmış ve kapanmamış bir /* ... */ yorumunun içinde başlar.
+#   - STATE_PREPROCESSOR: Önceki satır “\” ile biten bir direktifti; bu satır onun devamıdır.
+STATE_NORMAL = 0
+STATE_COMMENT = 1
+STATE_PREPROCESSOR = 2
+
+# Satır sonu durumunda, sonraki satırın başında devam eden token’ın tipi
+CONTINUATION_TYPES = {STATE_COMMENT: "COMMENT2", STATE_PREPROCESSOR: "PREPROCESSOR"}
+
+
+def tokenize_line(text: str, state: int = STATE_NORMAL) -> Tuple[List[Token], int]:
+    """
+    Tek bir satırı (newline içermeyen metni) tokenize eder ve (token listesi, satır sonu durumu)
+    döner. Düzenleyici her bloğu ayrı ayrı lex’leyebilsin diye, önceki satırın sonundaki
+    durum state parametresiyle verilir.
+    - Token’ların position/column alanları satır başına göredir, line alanı daima 1’dir.
+    - Satır açık bir yorumun içinde biterse dönen durum STATE_COMMENT, “\” ile biten bir
+      direktifle biterse STATE_PREPROCESSOR olur.
+    """
+    pos = 0
+    head: List[Token] = []
+    if state == STATE_PREPROCESSOR:
+        # Satırın tamamı direktifin devamı
+        end = _PREPROCESSOR_CONTINUATION.match(text).end()
+        if end:
+            head.append(Token("PREPROCESSOR", text[:end], 0, 1, 1))
+        return head, STATE_PREPROCESSOR if text.endswith("\\") else STATE_NORMAL
+    if state == STATE_COMMENT:
+        close = text.find("*/")
+        if close < 0:
+            # Satırın tamamı yorumun devamı
+            if text:
+                head.append(Token("COMMENT2", text, 0, 1, 1))
+            return head, STATE_COMMENT
+        pos = close + 2
+        head.append(Token("COMMENT2", text[:pos], 0, 1, 1))
+
+    tokens = _scan(text, pos)
+    end_state = STATE_NORMAL
+    if tokens:
+        last = tokens[-1]
+        # Kapanmamış yorum: “/*” ile başlayıp “*/” ile bitmeyen (en az 4 karakterlik) COMMENT2
+        if last.type == "COMMENT2" and (len(last.value) < 4 or not last.value.endswith("*/")):
+            end_state = STATE_COMMENT
+        elif last.type == "PREPROCESSOR" and last.value.endswith("\\"):
+            end_state = STATE_PREPROCESSOR
+    if head:
+        head.extend(tokens)
+        return head, end_state
+    return tokens, end_state
+
+
+def append_line_tokens(result: List[Token], tokens: List[Token], state: int):
+    """
+    join_line_tokens() için: bir satırın mutlak konumlu token’larını result’a ekler. state
+    satırın başlangıç durumudur; önceki satırdan devam eden yorum ya da direktif parçası
+    result’taki son token ile newline üzerinden tek bir token’da birleştirilir.
+    """
+    if state != STATE_NORMAL and result and result[-1].type == CONTINUATION_TYPES[state]:
+        prev = result[-1]
+        rest = tokens[0].value if tokens else ""
+        result[-1] = Token(prev.type, prev.value + "\n" + rest, prev.position, prev.line, prev.column)
+        result.extend(tokens[1:])
+    else:
+        result.extend(tokens)
+
+
+# Satır satır lex’lenmiş bir belgenin tek satırı:
+# (tokenize_line çıktısı, başlangıç durumu, satırın belgedeki konumu, 1 tabanlı satır numarası)
+LineTokens = Tuple[List[Token], int, int, int]
+
+
+def join_line_tokens(lines: Iterable[LineTokens]) -> List[Token]:
+    """
+    Satırların token’larını mutlak konumlu yeni Token’lar olarak append_line_tokens ile
+    birleştirir; sonuç tokenize(tüm_metin) ile aynıdır. Satır listeleri değiştirilmez.
+    """
+    result: List[Token] = []
+    for tokens, state, position, number in lines:
+        append_line_tokens(result, [Token(t.type, t.value, position + t.position, number, t.column)
+                                    for t in tokens], state)
+    return result
+
+
 # ----------------------------------------
 # 2. PARSER (RECURSIVE-DESCENT / TOP-DOWN) BÖLÜMÜ
 # ----------------------------------------
@@ -186,6 +323,13 @@ def tokenize(code: str) -> List[Token]:
 #
 # Hata bulunduğunda errors listesine (satır, kolon, mesaj) formatında ekler; hata yoksa boş liste döner.
 
+# Parser._parse_statements iş yığınındaki eylemler
+_ACTION_STATEMENT = 0
+_ACTION_BLOCK = 1
+_ACTION_BLOCK_BODY = 2
+_ACTION_ELSE = 3
+
+
 class Parser:
     """
     Basit C parser’ı (Top-Down recursive-descent).
@@ -201,6 +345,8 @@ class Parser:
         self.pos = 0
         # Bulunan hataları toplayacak liste
         self.errors: List[Tuple[int, int, str]] = []
+        # Üst seviyedeki fonksiyon tanımları: (isim, satır, kolon) — outline için
+        self.functions: List[Tuple[str, int, int]] = []
 
     def current(self) -> Token:
         """
@@ -270,9 +416,13 @@ class Parser:
         # type_spec kısmı (int/char/void)
         self.eat("KEYWORD")
         # IDENTIFIER kısmı
-        self.eat("IDENTIFIER")
+        name = self.eat("IDENTIFIER")
         # Şimdi bak: eğer "(" geliyorsa function definition
         if self.current().type == "SEPARATOR" and self.current().value == "(":
+            # İsim yerinde başka bir token varsa (ör. “int 5(x) {}”) hata zaten kaydedildi;
+            # outline’a yalnızca gerçek isimler girer
+            if name.type == "IDENTIFIER":
+                self.functions.append((name.value, name.line, name.column))
             self.parse_function_definition()
         else:
             # Yoksa declaration
@@ -358,51 +508,85 @@ class Parser:
         """
         compound_stmt ::= '{' stmt_list '}'
         """
-        # Blok başlangıcı '{'
-        if self.current().type == "SEPARATOR" and self.current().value == "{":
-            self.eat("SEPARATOR", "{")
-        else:
-            tok = self.current()
-            self.errors.append((tok.line, tok.column, "Missing '{' at start of block"))
-            self.pos += 1
-            return
-
-        # İçerideki satırları tek tek parse et
-        while not (self.current().type == "SEPARATOR" and self.current().value == "}"):
-            if self.current().type == "EOF":
-                # Eğer '}' gelmeden dosya biterse, unclosed block hatası
-                self.errors.append((self.current().line, self.current().column, "Unclosed '{'"))
-                return
-            self.parse_statement()
-
-        # Blok kapanışı '}'
-        self.eat("SEPARATOR", "}")
+        self._parse_statements(_ACTION_BLOCK)
 
     def parse_statement(self):
         """
         statement ::= expr_stmt | compound_stmt | selection_stmt | iteration_stmt | return_stmt
-        Burada, mevcut token’a bakarak hangi türde statement olduğu seçiliyor.
         """
-        tok = self.current()
-        if tok.type == "SEPARATOR" and tok.value == "{":
-            # İç içe blok
-            self.parse_compound_statement()
-        elif tok.type == "KEYWORD" and tok.value == "if":
-            # if (…) …
-            self.parse_selection_statement()
-        elif tok.type == "KEYWORD" and tok.value in ("while", "for"):
-            # while veya for
-            self.parse_iteration_statement()
-        elif tok.type == "KEYWORD" and tok.value == "return":
-            # return …
-            self.parse_return_statement()
-        else:
-            # Diğer tüm ifadeler
-            self.parse_expression_statement()
+        self._parse_statements(_ACTION_STATEMENT)
+
+    def _parse_statements(self, action: int):
+        """
+        Deyim ve blokları özyineleme yerine açık bir iş yığınıyla parse eder. Yığındaki her
+        eleman, “sırada ne yapılacak” bilgisidir (_ACTION_*):
+        - STATEMENT:  Yeni bir deyim başlat. Mevcut token’a bakarak hangi türde deyim olduğu
+                      seçilir; if/while/for başlığı okunduktan sonra gövdesi yine STATEMENT
+                      olarak yığına itilir.
+        - BLOCK:      '{' bekle; varsa bloğun gövdesine (BLOCK_BODY) geç.
+        - BLOCK_BODY: '}' gelene kadar sıradaki deyimi parse et; dosya biterse “Unclosed '{'”.
+        - ELSE:       if gövdesi bitti; 'else' varsa else gövdesini parse et.
+        İç içe geçme derinliği kadar yalnızca küçük tamsayılar yığılır; böylece on binlerce
+        seviyelik bloklar ve else-if zincirleri RecursionError vermeden doğrusal sürede işlenir.
+        Hata mesajları ve hata kurtarma davranışı özyinelemeli sürümle aynıdır.
+        """
+        stack = [action]
+        while stack:
+            action = stack.pop()
+            tok = self.current()
+
+            if action == _ACTION_STATEMENT:
+                if tok.type == "SEPARATOR" and tok.value == "{":
+                    # İç içe blok
+                    stack.append(_ACTION_BLOCK)
+                elif tok.type == "KEYWORD" and tok.value == "if":
+                    # if (…) gövde [else gövde]
+                    self.parse_selection_head()
+                    stack.append(_ACTION_ELSE)
+                    stack.append(_ACTION_STATEMENT)
+                elif tok.type == "KEYWORD" and tok.value in ("while", "for"):
+                    # while veya for
+                    if self.parse_iteration_head():
+                        stack.append(_ACTION_STATEMENT)
+                elif tok.type == "KEYWORD" and tok.value == "return":
+                    # return …
+                    self.parse_return_statement()
+                else:
+                    # Diğer tüm ifadeler
+                    self.parse_expression_statement()
+
+            elif action == _ACTION_BLOCK:
+                # Blok başlangıcı '{'
+                if tok.type == "SEPARATOR" and tok.value == "{":
+                    self.eat("SEPARATOR", "{")
+                    stack.append(_ACTION_BLOCK_BODY)
+                else:
+                    self.errors.append((tok.line, tok.column, "Missing '{' at start of block"))
+                    self.pos += 1
+
+            elif action == _ACTION_BLOCK_BODY:
+                if tok.type == "SEPARATOR" and tok.value == "}":
+                    # Blok kapanışı '}'
+                    self.eat("SEPARATOR", "}")
+                elif tok.type == "EOF":
+                    # Eğer '}' gelmeden dosya biterse, unclosed block hatası
+                    self.errors.append((tok.line, tok.column, "Unclosed '{'"))
+                else:
+                    # Bloğun içindeki sıradaki deyim, ardından tekrar gövdeye dön
+                    stack.append(_ACTION_BLOCK_BODY)
+                    stack.append(_ACTION_STATEMENT)
+
+            elif action == _ACTION_ELSE:
+                # else varsa
+                if tok.type == "KEYWORD" and tok.value == "else":
+                    self.eat("KEYWORD", "else")
+                    stack.append(_ACTION_STATEMENT)
 
-    def parse_selection_statement(self):
+    def parse_selection_head(self):
         """
         selection_stmt ::= 'if' '(' expression ')' statement ('else' statement)?
+        Yalnızca 'if' '(' expression ')' kısmını okur; gövde ve else kısmı
+        _parse_statements tarafından işlenir.
         """
         self.eat("KEYWORD", "if")
         if self.current().type == "SEPARATOR" and self.current().value == "(":
@@ -419,18 +603,12 @@ class Parser:
             self.errors.append((tok.line, tok.column, "Missing '(' after 'if'"))
             self.pos += 1
 
-        # if gövdesi
-        self.parse_statement()
-
-        # else varsa
-        if self.current().type == "KEYWORD" and self.current().value == "else":
-            self.eat("KEYWORD", "else")
-            self.parse_statement()
-
-    def parse_iteration_statement(self):
+    def parse_iteration_head(self) -> bool:
         """
         iteration_stmt ::= 'while' '(' expression ')' statement
                          | 'for' '(' expr_stmt expr_stmt (expression)? ')' statement
+        Döngü başlığını okur ve ardından bir gövde deyimi gelip gelmediğini döner
+        ('(' eksik bir for döngüsünün gövdesi parse edilmez).
         """
         if self.current().value == "while":
             # while
@@ -448,33 +626,31 @@ class Parser:
                 tok = self.current()
                 self.errors.append((tok.line, tok.column, "Missing '(' after 'while'"))
                 self.pos += 1
-            self.parse_statement()
+            return True
 
-        else:
-            # for döngüsü
-            self.eat("KEYWORD", "for")
-            if self.current().type == "SEPARATOR" and self.current().value == "(":
-                self.eat("SEPARATOR", "(")
-                self.parse_expression_statement()   # 1. ifade
-                self.parse_expression_statement()   # 2. ifade
+        # for döngüsü
+        self.eat("KEYWORD", "for")
+        if self.current().type == "SEPARATOR" and self.current().value == "(":
+            self.eat("SEPARATOR", "(")
+            self.parse_expression_statement()   # 1. ifade
+            self.parse_expression_statement()   # 2. ifade
+            if self.current().type == "SEPARATOR" and self.current().value == ")":
+                # Üçüncü ifade yoksa doğrudan )
+                self.eat("SEPARATOR", ")")
+            else:
+                # Üçüncü ifade var
+                self.parse_expression()
                 if self.current().type == "SEPARATOR" and self.current().value == ")":
-                    # Üçüncü ifade yoksa doğrudan )
                     self.eat("SEPARATOR", ")")
                 else:
-                    # Üçüncü ifade var
-                    self.parse_expression()
-                    if self.current().type == "SEPARATOR" and self.current().value == ")":
-                        self.eat("SEPARATOR", ")")
-                    else:
-                        tok = self.current()
-                        self.errors.append((tok.line, tok.column, "Missing ')' after for clauses"))
-                        self.pos += 1
-                # for gövdesi
-                self.parse_statement()
-            else:
-                tok = self.current()
-                self.errors.append((tok.line, tok.column, "Missing '(' after 'for'"))
-                self.pos += 1
+                    tok = self.current()
+                    self.errors.append((tok.line, tok.column, "Missing ')' after for clauses"))
+                    self.pos += 1
+            return True
+        tok = self.current()
+        self.errors.append((tok.line, tok.column, "Missing '(' after 'for'"))
+        self.pos += 1
+        return False
 
     def parse_return_statement(self):
         """
@@ -0,0 +1,209 @@
+# renderer.py
+
+import argparse
+import html
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Dict, List, Optional, Tuple
+
+from parseTree import tokenize, TOKEN_STYLES
+
+# ----------------------------------------
+# QT’SİZ TOPLU VURGULAMA (HTML / ANSI)
+# ----------------------------------------
+#
+# Kod incelemesi için vurgulanmış C listeleri üretir. QTextDocument + QSyntaxHighlighter
+# kullanılmaz; parseTree.tokenize() çıktısı doğrudan HTML <span> etiketlerine ya da ANSI renk
+# kodlarına dönüştürülür. Renkler CSyntaxHighlighter ile aynı tablodan (TOKEN_STYLES) gelir.
+#
+# Çıktı tek seferde birleştirilmez; her token için önceden hazırlanmış açılış/kapanış
+# parçaları, token’ın kendi value’su ve token’lar arasındaki boşluk dilimleri bir listede
+# toplanıp belirli aralıklarla tamponlu dosyaya writelines() ile yazılır. HTML kaçışı yalnızca
+# < > & içerebilecek token tiplerine uygulanır.
+#
+# Kullanım:
+#   python renderer.py dosya.c                       → ANSI, stdout
+#   python renderer.py --format html -o out/ src/    → src/ altındaki *.c, *.h → out/*.html
+#   python renderer.py -j 8 -o out/ src/             → 8 süreçlik havuzla
+
+# Kaçış gerektirmeyen token tipleri (yalnızca harf, rakam, _ ve . içerebilir)
+_PLAIN_TYPES = frozenset(("IDENTIFIER", "KEYWORD", "NUMBER", "HEXNUMBER"))
+
+# CSyntaxHighlighter’ın kullandığı Qt renk adlarının RGB karşılıkları
+_NAMED_COLORS = {
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "blue": (0, 0, 255),
+    "magenta": (255, 0, 255),
+}
+
+_FLUSH_PIECES = 8192      # writelines() öncesi biriktirilecek parça sayısı
+_BUFFER_SIZE = 1 << 16    # Çıktı dosyası tampon boyutu
+
+
+def _rgb(color: str) -> Tuple[int, int, int]:
+    if color.startswith("#"):
+        return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    return _NAMED_COLORS[color]
+
+
+def _html_tags() -> Dict[str, Tuple[str, str]]:
+    return {kind: (f'<span class="c-{kind.lower()}">', "</span>") for kind in TOKEN_STYLES}
+
+
+def _ansi_tags() -> Dict[str, Tuple[str, str]]:
+    tags = {}
+    for kind, (color, bold, italic) in TOKEN_STYLES.items():
+        r, g, b = _rgb(color)
+        codes = [f"38;2;{r};{g};{b}"]
+        if bold:
+            codes.append("1")
+        if italic:
+            codes.append("3")
+        tags[kind] = (f"\x1b[{';'.join(codes)}m", "\x1b[0m")
+    return tags
+
+
+def html_stylesheet() -> str:
+    """
+    TOKEN_STYLES tablosundan HTML çıktısı için CSS kuralları üretir.
+    """
+    rules = []
+    for kind, (color, bold, italic) in TOKEN_STYLES.items():
+        decl = f"color: {color};"
+        if bold:
+            decl += " font-weight: bold;"
+        if italic:
+            decl += " font-style: italic;"
+        rules.append(f".c-{kind.lower()} {{ {decl} }}")
+    return "\n".join(rules)
+
+
+def render(code: str, out: IO[str], fmt: str = "ansi"):
+    """
+    code’u tokenize edip fmt ("html" veya "ansi") biçiminde out’a yazar.
+    HTML modunda yalnızca <pre> içeriği üretilir; tam sayfa için render_file() kullanılır.
+    """
+    is_html = fmt == "html"
+    tags = _html_tags() if is_html else _ansi_tags()
+    escape = html.escape
+    pieces: List[str] = []
+    append = pieces.append
+    last = 0
+
+    for tok in tokenize(code):
+        start = tok.position
+        if start > last:
+            # Token’lar arası yalnızca boşluk içerir; kaçış gerekmez
+            append(code[last:start])
+        value = tok.value
+        last = start + len(value)
+        tag = tags.get(tok.type)
+        if is_html and tok.type not in _PLAIN_TYPES:
+            value = escape(value, quote=False)
+        if tag is None:
+            append(value)
+        else:
+            append(tag[0])
+            append(value)
+            append(tag[1])
+        if len(pieces) >= _FLUSH_PIECES:
+            out.writelines(pieces)
+            pieces.clear()
+
+    if last < len(code):
+        append(code[last:])
+    out.writelines(pieces)
+
+
+def render_file(src: str, dst: Optional[str], fmt: str = "ansi") -> str:
+    """
+    Tek bir kaynak dosyayı vurgulayıp dst’ye (None ise stdout’a) yazar; dst’yi döner.
+    """
+    with open(src, encoding="utf-8", errors="replace") as f:
+        code = f.read()
+    if dst is None:
+        render(code, sys.stdout, fmt)
+        return "-"
+
+    os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+    with open(dst, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as out:
+        if fmt == "html":
+            title = html.escape(os.path.basename(src))
+            out.write(f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{title}</title>\n"
+                      f"<style>\npre.c-source {{ background: #dcdcdc; }}\n{html_stylesheet()}\n"
+                      f"</style></head><body>\n<pre class=\"c-source\">")
+            render(code, out, fmt)
+            out.write("</pre>\n</body></html>\n")
+        else:
+            render(code, out, fmt)
+    return dst
+
+
+def collect_jobs(paths: List[str], out_dir: Optional[str], fmt: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    (kaynak, hedef) çiftlerini üretir. Dizinler içindeki *.c ve *.h dosyaları, göreli yolları
+    korunarak out_dir altına yazılır; dizin verildiyse out_dir zorunludur. Var olmayan bir yol
+    ya da aynı hedefe yazılacak iki kaynak (ör. a/x.c ve b/x.c) ValueError verir.
+    """
+    ext = ".html" if fmt == "html" else ".ansi"
+    jobs = []
+    for path in paths:
+        if not os.path.exists(path):
+            raise ValueError(f"no such file or directory: {path!r}")
+        if os.path.isdir(path):
+            if out_dir is None:
+                raise ValueError(f"an output directory is required to render {path!r}")
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.endswith((".c", ".h")):
+                        src = os.path.join(root, name)
+                        rel = os.path.relpath(src, path)
+                        jobs.append((src, os.path.join(out_dir, rel + ext)))
+        else:
+            dst = os.path.join(out_dir, os.path.basename(path) + ext) if out_dir else None
+            jobs.append((path, dst))
+
+    sources = {}
+    for src, dst in jobs:
+        if dst is None:
+            continue
+        dst_key = os.path.normcase(os.path.abspath(dst))
+        if dst_key in sources:
+            raise ValueError(f"{sources[dst_key]!r} and {src!r} would both be written to {dst!r}")
+        sources[dst_key] = src
+    return jobs
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render highlighted C sources as HTML or ANSI text.")
+    ap.add_argument("paths", nargs="+", help="C source files or directories")
+    ap.add_argument("--format", choices=("ansi", "html"), default="ansi")
+    ap.add_argument("-o", "--output", help="output directory (required for directories)")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                    help="worker processes for directory rendering")
+    args = ap.parse_args(argv)
+
+    if args.output is None and any(os.path.isdir(path) for path in args.paths):
+        ap.error("--output is required when rendering a directory")
+    try:
+        jobs = collect_jobs(args.paths, args.output, args.format)
+    except ValueError as exc:
+        ap.error(str(exc))
+    if any(dst is None for _, dst in jobs) and len(jobs) > 1:
+        ap.error("--output is required when rendering more than one file")
+
+    if len(jobs) <= 1 or args.jobs <= 1:
+        for src, dst in jobs:
+            render_file(src, dst, args.format)
+        return
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(render_file, src, dst, args.format) for src, dst in jobs]
+        for fut in futures:
+            fut.result()
+
+
+if __name__ == "__main__":
+    main()
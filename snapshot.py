@@ -0,0 +1,276 @@
+# snapshot.py
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple
+
+import parseTree
+from parseTree import Token
+
+# ----------------------------------------
+# TOKEN ANLIK GÖRÜNTÜSÜ (SNAPSHOT) ÖNBELLEĞİ
+# ----------------------------------------
+#
+# Büyük bir dosya yeniden açıldığında tüm satırları lex’leyip parse etmek yerine, önceki
+# oturumun sonucu yerel bir önbellek dizininden okunur. Dosyanın bayt içeriğinin hash’i
+# anahtardır; içerik değiştiyse anlık görüntü bulunmaz ve normal (arka planda) analiz yapılır.
+#
+# Dosya biçimi (sabit başlık + 4 bayta hizalanmış bölümler, diziler yerel bayt sırasında):
+#   başlık     MAGIC, sürüm, bayt sırası, parseTree parmak izi, sayılar
+#   names      Token tipi adları (utf-8, "\n" ile ayrılmış); tip kimliği = listedeki sıra
+#   starts     uint32[n_lines + 1]   Satırın ilk token’ının indeksi (son eleman n_tokens)
+#   positions  uint32[n_tokens]      Token’ın satır içindeki konumu
+#   lengths    uint32[n_tokens]      Token uzunluğu (değer, satır metninden kesilir)
+#   states     uint8[2 * n_lines]    Satırın başlangıç ve bitiş lexer durumu
+#   types      uint8[n_tokens]       Tip kimliği
+#   errors     uint32[2 * n_errors]  Parser hatalarının (satır, kolon) çiftleri
+#   outline    uint32[2 * n_outline] Fonksiyonların (satır, kolon) çiftleri
+#   str_lens   uint32[n_errors + n_outline]  Hata mesajlarının ve fonksiyon adlarının uzunluğu
+#   strings    utf-8, hata mesajları ve fonksiyon adları art arda (ayraç yok; mesajlar kaynaktaki
+#              her karakteri, "\0" dahil, içerebilir)
+#
+# Okuma mmap ile yapılır; token bölümleri memoryview.cast ile doğrudan eşlemeden ve yalnızca
+# bir satır istendiğinde dilimlenir. Parmak izi parseTree.py’nin içeriğinden hesaplanır: lexer
+# veya parser değişince eski anlık görüntüler kendiliğinden geçersiz olur.
+
+MAGIC = b"CTSN"
+FORMAT_VERSION = 2
+MAX_SNAPSHOTS = 256       # Önbellek dizininde tutulacak en fazla dosya (en eskiler silinir)
+
+_HEADER = struct.Struct("<4sHH16sIIIIII")
+_BYTEORDER = 0 if sys.byteorder == "little" else 1
+_fingerprint: Optional[bytes] = None
+
+
+def cache_dir() -> str:
+    """
+    Anlık görüntülerin yazıldığı dizin: C_HIGHLIGHTER_CACHE ortam değişkeni, yoksa
+    $XDG_CACHE_HOME (varsayılan ~/.cache) altında c-syntax-highlighter/snapshots.
+    """
+    path = os.environ.get("C_HIGHLIGHTER_CACHE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "c-syntax-highlighter", "snapshots")
+
+
+def content_key(data: bytes) -> str:
+    """
+    Dosya içeriğinin (ham baytlar) hash’i; anlık görüntünün dosya adı olarak kullanılır.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def snapshot_path(key: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or cache_dir(), key + ".snap")
+
+
+def fingerprint() -> bytes:
+    """
+    parseTree.py içeriğinin ve biçim sürümünün hash’i.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        with open(parseTree.__file__, "rb") as f:
+            source = f.read()
+        _fingerprint = hashlib.blake2b(source + struct.pack("<H", FORMAT_VERSION),
+                                       digest_size=16).digest()
+    return _fingerprint
+
+
+def _pad(n: int) -> int:
+    return (n + 3) & ~3
+
+
+class Snapshot:
+    """
+    Açık bir anlık görüntü. line(i, text, state) satırın token’larını ve bitiş durumunu
+    eşlemeden okuyarak döner; errors ve outline açılışta listeye çevrilir.
+    Eşleme close() çağrılana kadar açık kalır.
+    """
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        self._views: List[memoryview] = []
+        try:
+            self._read(mm)
+        except Exception:
+            self.close()
+            raise
+
+    def _read(self, mm: mmap.mmap):
+        (_, _, _, _, n_lines, n_tokens, n_errors, n_outline,
+         names_len, strings_len) = _HEADER.unpack_from(mm, 0)
+        view = memoryview(mm)
+        self._views.append(view)
+        offset = _HEADER.size
+
+        def take(size: int, fmt: str) -> memoryview:
+            nonlocal offset
+            if offset + size > len(mm):
+                raise ValueError("truncated snapshot")
+            section = view[offset:offset + size].cast(fmt)
+            self._views.append(section)
+            offset += _pad(size)
+            return section
+
+        names = bytes(take(names_len, "B")).decode("utf-8").split("\n")
+        self._starts = take(4 * (n_lines + 1), "I")
+        self._positions = take(4 * n_tokens, "I")
+        self._lengths = take(4 * n_tokens, "I")
+        self._states = take(2 * n_lines, "B")
+        self._types = take(n_tokens, "B")
+        errors = take(8 * n_errors, "I").tolist()
+        outline = take(8 * n_outline, "I").tolist()
+        bounds = list(accumulate(take(4 * (n_errors + n_outline), "I").tolist(), initial=0))
+        strings = bytes(take(strings_len, "B")).decode("utf-8")
+        if bounds[-1] != len(strings) or self._starts[n_lines] != n_tokens:
+            raise ValueError("inconsistent snapshot")
+
+        self.line_count = n_lines
+        self.token_count = n_tokens
+        self.names = names
+        self.errors: List[Tuple[int, int, str]] = [
+            (errors[2 * i], errors[2 * i + 1], strings[bounds[i]:bounds[i + 1]])
+            for i in range(n_errors)]
+        self.outline: List[Tuple[str, int, int]] = [
+            (strings[bounds[n_errors + i]:bounds[n_errors + i + 1]], outline[2 * i], outline[2 * i + 1])
+            for i in range(n_outline)]
+
+    def line(self, index: int, text: str, state: int) -> Optional[Tuple[List[Token], int]]:
+        """
+        index’inci satırın tokenize_line(text, state) ile aynı biçimdeki (tokens, bitiş durumu)
+        çifti. Token değerleri satır metninden kesilir. Satır anlık görüntüde yoksa, başlangıç
+        durumu farklıysa ya da token’lar metnin dışına taşıyorsa None döner (satır lex’lenmeli).
+        """
+        if index >= self.line_count or self._states[2 * index] != state:
+            return None
+        lo, hi = self._starts[index], self._starts[index + 1]
+        if lo > hi or hi > self.token_count:
+            return None
+        if hi > lo and self._positions[hi - 1] + self._lengths[hi - 1] > len(text):
+            return None
+        names = self.names
+        tokens = [Token(names[kind], text[pos:pos + length], pos, 1, pos + 1)
+                  for kind, pos, length in zip(self._types[lo:hi], self._positions[lo:hi],
+                                               self._lengths[lo:hi])]
+        return tokens, self._states[2 * index + 1]
+
+    def close(self):
+        """
+        Eşlemeyi kapatır. mmap ancak ondan türetilen tüm memoryview’lar bırakıldıktan sonra
+        kapatılabilir; errors ve outline kullanılmaya devam edebilir.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mm.close()
+
+
+def load_snapshot(key: str, directory: Optional[str] = None) -> Optional[Snapshot]:
+    """
+    Anahtara ait anlık görüntüyü açar. Dosya yoksa, bozuksa ya da başka bir lexer/parser
+    sürümüyle yazılmışsa None döner.
+    """
+    path = snapshot_path(key, directory)
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        if len(mm) < _HEADER.size:
+            raise ValueError("truncated snapshot")
+        magic, version, byteorder, stamp = _HEADER.unpack_from(mm, 0)[:4]
+        if magic != MAGIC or version != FORMAT_VERSION or byteorder != _BYTEORDER \
+                or stamp != fingerprint():
+            raise ValueError("incompatible snapshot")
+    except (ValueError, struct.error):
+        mm.close()
+        return None
+    try:
+        # Başarılı olursa eşleme Snapshot.close()’a kadar açık kalır; hata durumunda
+        # Snapshot kendi görünümlerini bırakıp eşlemeyi kapatır
+        return Snapshot(mm)
+    except (ValueError, TypeError, IndexError, UnicodeDecodeError):
+        return None
+
+
+def write_snapshot(key: str, lines: Iterable[Tuple[List[Token], int, int]],
+                   errors: List[Tuple[int, int, str]],
+                   outline: List[Tuple[str, int, int]],
+                   directory: Optional[str] = None) -> bool:
+    """
+    Satır önbelleklerini (tokenize_line çıktısı, başlangıç ve bitiş durumu), parser
+    hatalarını ve outline’ı anahtar adıyla yazar. Dosya önce geçici adla yazılıp yerine
+    taşınır; yazılamazsa (ör. salt okunur dizin) False döner.
+    """
+    type_ids = {}
+    starts, positions, lengths = array("I", [0]), array("I"), array("I")
+    states, types = array("B"), array("B")
+    for tokens, start_state, end_state in lines:
+        starts.append(starts[-1] + len(tokens))
+        states.append(start_state)
+        states.append(end_state)
+        for tok in tokens:
+            kind = type_ids.setdefault(tok.type, len(type_ids))
+            types.append(kind)
+            positions.append(tok.position)
+            lengths.append(len(tok.value))
+
+    err = array("I")
+    for line, col, _ in errors:
+        err.extend((line, col))
+    out = array("I")
+    for _, line, col in outline:
+        out.extend((line, col))
+    names = "\n".join(type_ids).encode("utf-8")
+    texts = [msg for _, _, msg in errors] + [name for name, _, _ in outline]
+    str_lens = array("I", [len(text) for text in texts])
+    strings = "".join(texts).encode("utf-8")
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, _BYTEORDER, fingerprint(), len(starts) - 1, len(types),
+                          len(errors), len(outline), len(names), len(strings))
+    sections = [names, starts.tobytes(), positions.tobytes(), lengths.tobytes(),
+                states.tobytes(), types.tobytes(), err.tobytes(), out.tobytes(), str_lens.tobytes()]
+
+    directory = directory or cache_dir()
+    path = snapshot_path(key, directory)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(header)
+            for section in sections:
+                f.write(section)
+                f.write(b"\0" * (_pad(len(section)) - len(section)))
+            f.write(strings)
+        os.replace(tmp, path)
+        _prune(directory)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def _prune(directory: str):
+    """
+    Dizinde MAX_SNAPSHOTS’tan fazla anlık görüntü varsa en eski değiştirilenleri siler.
+    """
+    entries = [e for e in os.scandir(directory) if e.name.endswith(".snap")]
+    if len(entries) <= MAX_SNAPSHOTS:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:len(entries) - MAX_SNAPSHOTS]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
@@ -0,0 +1,96 @@
+# test_highlighter.py
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+from PyQt5.QtGui import QColor, QTextCharFormat, QTextCursor  # noqa: E402
+
+from CLanguageSyntaxHighlighter import CSyntaxHighlighter  # noqa: E402
+from code_editor import CodeEditor  # noqa: E402
+from parseTree import join_line_tokens, tokenize  # noqa: E402
+
+# CSyntaxHighlighter’ın düzenleme başına sayaçları (last_edit_blocks / last_edit_lexed):
+# 400 fonksiyonluk bir belgede 800. satır tek satırlık bir yorumdur ("/* x */").
+
+COMMENT_LINE = 800
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def editor(app):
+    lines = []
+    for i in range(400):
+        lines += [f"int f{i}(int a) {{", "  if (a) { return a; }", "  return 0;", "}"]
+    lines[COMMENT_LINE] = "/* x */"
+    editor = CodeEditor()
+    highlighter = CSyntaxHighlighter(editor.document())
+    editor.setPlainText("\n".join(lines))
+    app.processEvents()
+    yield editor, highlighter
+    editor.deleteLater()
+
+
+def _cursor(editor, line, column=0):
+    cursor = QTextCursor(editor.document().findBlockByNumber(line))
+    cursor.movePosition(QTextCursor.Right, n=column)
+    return cursor
+
+
+def test_typed_character_relexes_one_block(editor):
+    editor, highlighter = editor
+    _cursor(editor, 100, 3).insertText("x")
+    assert highlighter.last_edit_blocks == 1
+    assert highlighter.last_edit_lexed == 1
+
+
+def test_comment_opener_relexes_up_to_next_closer(editor):
+    editor, highlighter = editor
+    _cursor(editor, 200).insertText("/")
+    assert highlighter.last_edit_blocks == 1
+
+    # "/*" 200. satırdan itibaren her satırın sonunu yorum içine alır; 800. satırdaki "*/"
+    # durumu eski haline döndürür ve vurgulama orada durur
+    _cursor(editor, 200, 1).insertText("*")
+    assert highlighter.last_edit_blocks == COMMENT_LINE - 200 + 1
+    assert highlighter.last_edit_lexed == COMMENT_LINE - 200 + 1
+
+
+def test_line_tokens_join_to_full_tokenize(editor):
+    editor, highlighter = editor
+    # Parser’a blokların önbellekteki token’ları gider; belge yeniden lex’lenmez
+    _cursor(editor, 200).insertText("/* ")
+    before = highlighter.total_lexed
+    lines = editor.line_tokens()
+    assert highlighter.total_lexed == before
+    key = [(t.type, t.value, t.position, t.line, t.column) for t in join_line_tokens(lines)]
+    assert key == [(t.type, t.value, t.position, t.line, t.column)
+                   for t in tokenize(editor.toPlainText())]
+
+
+def test_format_only_change_lexes_nothing(editor, app):
+    editor, highlighter = editor
+    edits = []
+    editor.contents_edited.connect(lambda: edits.append(True))
+    before = highlighter.total_lexed
+
+    cursor = _cursor(editor, 10)
+    cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+    fmt = QTextCharFormat()
+    fmt.setBackground(QColor("yellow"))
+    cursor.setCharFormat(fmt)
+    app.processEvents()
+
+    # Qt değişen aralığın bloklarını yeniden vurgular, ama metin aynı olduğundan token’lar
+    # önbellekten gelir
+    assert highlighter.last_edit_blocks > 0
+    assert highlighter.last_edit_lexed == 0
+    assert highlighter.total_lexed == before
+    assert edits == []
@@ -0,0 +1,71 @@
+# test_lexer.py
+
+import pytest
+
+from parseTree import STATE_NORMAL, append_line_tokens, tokenize, tokenize_line, Token
+
+# (kaynak, beklenen (tip, değer) listesi)
+CASES = [
+    ("unsigned long x;", [("KEYWORD", "unsigned"), ("KEYWORD", "long"), ("IDENTIFIER", "x"),
+                          ("SEPARATOR", ";")]),
+    ("10UL", [("NUMBER", "10UL")]),
+    ("017 1e-5L 3.14", [("NUMBER", "017"), ("NUMBER", "1e-5L"), ("NUMBER", "3.14")]),
+    (".5f", [("NUMBER", ".5f")]),
+    ("0x1A3Fu 0x1.8p3", [("HEXNUMBER", "0x1A3Fu"), ("HEXNUMBER", "0x1.8p3")]),
+    ("f(int, ...)", [("IDENTIFIER", "f"), ("SEPARATOR", "("), ("KEYWORD", "int"),
+                     ("SEPARATOR", ","), ("OP", "..."), ("SEPARATOR", ")")]),
+    ("a %= b", [("IDENTIFIER", "a"), ("OP", "%="), ("IDENTIFIER", "b")]),
+    ("a <<= 2", [("IDENTIFIER", "a"), ("OP", "<<="), ("NUMBER", "2")]),
+    ("a &= b", [("IDENTIFIER", "a"), ("OP", "&="), ("IDENTIFIER", "b")]),
+    ("a |= b", [("IDENTIFIER", "a"), ("OP", "|="), ("IDENTIFIER", "b")]),
+    ("p->x", [("IDENTIFIER", "p"), ("OP", "->"), ("IDENTIFIER", "x")]),
+    ('u8"utf"', [("STRING_LITERAL", 'u8"utf"')]),
+    ('L"wide"', [("STRING_LITERAL", 'L"wide"')]),
+    ("L'x' u'\\n'", [("CHAR_LITERAL", "L'x'"), ("CHAR_LITERAL", "u'\\n'")]),
+    ("a<:1:> <%%>", [("IDENTIFIER", "a"), ("SEPARATOR", "<:"), ("NUMBER", "1"),
+                     ("SEPARATOR", ":>"), ("SEPARATOR", "<%"), ("SEPARATOR", "%>")]),
+    ("%:define X 1", [("PREPROCESSOR", "%:define X 1")]),
+    ("  %:include <a.h>", [("PREPROCESSOR", "%:include <a.h>")]),
+    ("x %:%: y", [("IDENTIFIER", "x"), ("OP", "%:%:"), ("IDENTIFIER", "y")]),
+    ("a @ b", [("IDENTIFIER", "a"), ("UNKNOWN", "@"), ("IDENTIFIER", "b")]),
+]
+
+SOURCE = "\n".join([
+    "#define MAX(a, b) \\",
+    "    ((a) > (b) ? (a) : (b))",
+    "/* yorum",
+    "   devam */ int x = 10UL;",
+    "",
+    "unsigned long f(int n, ...) {",
+    '  const char *s = u8"a" L"b";  // satır sonu',
+    "  n <<= 2; n %= 3; n &= 1; n |= .5f;",
+    "  return n; /* tek satır */",
+    "}",
+    "/* kapanmamış",
+])
+
+
+@pytest.mark.parametrize("code, expected", CASES)
+def test_token_table(code, expected):
+    assert [(t.type, t.value) for t in tokenize(code)] == expected
+
+
+@pytest.mark.parametrize("code, expected", CASES)
+def test_tokenize_line_matches_table(code, expected):
+    tokens, state = tokenize_line(code)
+    assert [(t.type, t.value) for t in tokens] == expected
+    assert state == STATE_NORMAL
+
+
+def test_lines_join_to_full_tokenize():
+    result = []
+    state = STATE_NORMAL
+    position = 0
+    for number, text in enumerate(SOURCE.split("\n"), 1):
+        tokens, end_state = tokenize_line(text, state)
+        append_line_tokens(result, [Token(t.type, t.value, position + t.position, number, t.column)
+                                    for t in tokens], state)
+        state = end_state
+        position += len(text) + 1
+    key = lambda tokens: [(t.type, t.value, t.position, t.line, t.column) for t in tokens]
+    assert key(result) == key(tokenize(SOURCE))
@@ -0,0 +1,217 @@
+# test_lsp_server.py
+
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lsp_server import (
+    CONTENT_MODIFIED,
+    REQUEST_CANCELLED,
+    TextDocument,
+    encode_message,
+    read_message,
+    serve,
+)
+from parseTree import join_line_tokens, tokenize
+
+# serve() bir socketpair’in bir ucunda çalışır; diğer uçtaki Client yerel test istemcisidir.
+
+URI = "file:///test.c"
+BROKEN = "int main() {\n  return 0\n}\n"      # ';' eksik
+FIXED = "int main() {\n  return 0;\n}\n"
+DEBOUNCE = 0.05
+TIMEOUT = 5.0
+
+
+def _request(request_id, method, params=None):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+
+
+def _notification(method, params=None):
+    return {"jsonrpc": "2.0", "method": method, "params": params or {}}
+
+
+def _did_change(version, changes):
+    return _notification("textDocument/didChange",
+                         {"textDocument": {"uri": URI, "version": version}, "contentChanges": changes})
+
+
+def _insert(line, character, text):
+    pos = {"line": line, "character": character}
+    return {"range": {"start": pos, "end": pos}, "text": text}
+
+
+def _semantic_tokens(request_id):
+    return _request(request_id, "textDocument/semanticTokens/full", {"textDocument": {"uri": URI}})
+
+
+class Client:
+    """
+    Sunucuya bağlı test istemcisi. send() verilen mesajların hepsini tek write() ile yazar;
+    böylece sunucu onları araya başka olay girmeden art arda okur.
+    """
+
+    def __init__(self, reader, writer, server):
+        self.reader = reader
+        self.writer = writer
+        self.server = server
+
+    def send(self, *messages):
+        self.writer.write(b"".join(encode_message(m) for m in messages))
+
+    async def receive(self, timeout=TIMEOUT):
+        return await asyncio.wait_for(read_message(self.reader), timeout)
+
+    async def publish(self):
+        message = await self.receive()
+        assert message["method"] == "textDocument/publishDiagnostics"
+        return message["params"]
+
+    async def responses(self, *ids):
+        """
+        Verilen id’lerin yanıtlarını toplar; arada gelen bildirimler atlanır.
+        """
+        found = {}
+        while len(found) < len(ids):
+            message = await self.receive()
+            if message.get("id") in ids:
+                found[message["id"]] = message
+        return found
+
+    async def exit(self, shutdown=True):
+        if shutdown:
+            self.send(_request("shutdown-id", "shutdown"))
+            assert (await self.responses("shutdown-id"))["shutdown-id"]["result"] is None
+        self.send(_notification("exit"))
+        code = await asyncio.wait_for(self.server, TIMEOUT)
+        self.writer.close()
+        return code
+
+
+async def _connect(text=None):
+    server_sock, client_sock = socket.socketpair()
+    reader, writer = await asyncio.open_connection(sock=server_sock)
+    server = asyncio.create_task(serve(reader, writer, debounce=DEBOUNCE))
+    client = Client(*await asyncio.open_connection(sock=client_sock), server)
+    client.send(_request(0, "initialize"), _notification("initialized"))
+    assert "capabilities" in (await client.responses(0))[0]["result"]
+    if text is not None:
+        client.send(_notification("textDocument/didOpen", {"textDocument": {
+            "uri": URI, "languageId": "c", "version": 1, "text": text}}))
+    return client
+
+
+def test_did_open_publishes_diagnostics():
+    async def run():
+        client = await _connect(BROKEN)
+        params = await client.publish()
+        assert params["uri"] == URI
+        assert params["version"] == 1
+        first = params["diagnostics"][0]
+        assert first["message"] == "Missing ';' after return"
+        assert first["range"]["start"] == {"line": 2, "character": 0}
+        assert first["severity"] == 1
+        assert await client.exit() == 0
+
+    asyncio.run(run())
+
+
+def test_analysis_failure_is_published():
+    async def run():
+        # Parser ifadeleri özyinelemeyle okur; 300 seviyelik parantez RecursionError verir
+        client = await _connect("int main() {\n  x = " + "(" * 300 + "1" + ")" * 300 + ";\n}\n")
+        params = await client.publish()
+        assert params["version"] == 1
+        [diagnostic] = params["diagnostics"]
+        assert diagnostic["message"].startswith("Analysis failed: RecursionError")
+        assert await client.exit() == 0
+
+    asyncio.run(run())
+
+
+def test_rapid_changes_are_coalesced_into_one_publish():
+    async def run():
+        client = await _connect(BROKEN)
+        await client.publish()
+        # Sekiz değişiklik debounce süresinden çok daha kısa sürede gelir; sonuncusu ';' ekler
+        changes = [_did_change(v, [_insert(0, 0, " ")]) for v in range(2, 9)]
+        changes.append(_did_change(9, [_insert(1, 10, ";")]))
+        client.send(*changes)
+
+        params = await client.publish()
+        assert params["version"] == 9
+        assert params["diagnostics"] == []
+        with pytest.raises(asyncio.TimeoutError):
+            await client.receive(timeout=10 * DEBOUNCE)
+        assert await client.exit() == 0
+
+    asyncio.run(run())
+
+
+def test_pending_semantic_tokens_are_cancelled():
+    async def run():
+        # Varsayılan executor kilitlenir; semanticTokens istekleri yanıtlanamadan beklemede kalır
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        gate = threading.Event()
+        blocker = loop.run_in_executor(None, gate.wait)
+
+        client = await _connect(FIXED)
+        await client.publish()
+        client.send(_semantic_tokens(1),
+                    _semantic_tokens(2),
+                    _notification("$/cancelRequest", {"id": 2}),
+                    _did_change(2, [_insert(0, 0, " ")]))
+        replies = await client.responses(1, 2)
+        gate.set()
+        await blocker
+        assert replies[1]["error"]["code"] == CONTENT_MODIFIED
+        # Önce $/cancelRequest geldiği için sonraki belge değişikliği kodu değiştirmez
+        assert replies[2]["error"]["code"] == REQUEST_CANCELLED
+
+        client.send(_semantic_tokens(3))
+        assert (await client.responses(3))[3]["result"]["data"]
+        assert await client.exit() == 0
+
+    asyncio.run(run())
+
+
+def test_relex_stops_at_state_convergence():
+    lines = [f"int x{i};" for i in range(50)]
+    lines[30] += " */"
+    doc = TextDocument(URI, 1, "\n".join(lines))
+    assert doc.relexed == 50
+
+    # Satır sonu durumu değişmiyor: yalnızca düzenlenen satır
+    doc.apply_change(_insert(10, 0, "y"))
+    assert doc.relexed == 1
+
+    # Açılan yorum 30. satırdaki "*/" ile kapanır; 31. satırdan itibaren durumlar aynı kalır
+    doc.apply_change(_insert(10, 0, "/*"))
+    assert doc.relexed == 21
+    assert doc.states[29] != doc.states[30]
+
+    # Yorum kapatılınca yine yalnızca aynı satır aralığı yeniden lex’lenir
+    doc.apply_change({"range": {"start": {"line": 10, "character": 0},
+                                "end": {"line": 10, "character": 2}}, "text": ""})
+    assert doc.relexed == 21
+
+
+def test_snapshot_joins_to_full_tokenize():
+    doc = TextDocument(URI, 1, "int a; /* x\n y */ int b;\n#define M \\\n  1\nchar *s = \"t\";\n")
+    doc.apply_change(_insert(1, 0, "int c; "))
+    key = [(t.type, t.value, t.position, t.line, t.column) for t in join_line_tokens(doc.snapshot())]
+    assert key == [(t.type, t.value, t.position, t.line, t.column) for t in tokenize(doc.text())]
+
+
+def test_exit_code():
+    async def run():
+        client = await _connect()
+        assert await client.exit(shutdown=True) == 0
+        client = await _connect()
+        assert await client.exit(shutdown=False) == 1
+
+    asyncio.run(run())
@@ -0,0 +1,21 @@
+# test_parser.py
+
+from parseTree import Parser, tokenize
+
+
+def _parse(code):
+    parser = Parser(tokenize(code))
+    errors = parser.parse()
+    return parser, errors
+
+
+def test_outline_lists_top_level_functions():
+    parser, errors = _parse("int x;\nint main() {\n  return 0;\n}\nchar f(int a) { return a; }\n")
+    assert errors == []
+    assert parser.functions == [("main", 2, 5), ("f", 5, 6)]
+
+
+def test_outline_skips_non_identifier_names():
+    parser, errors = _parse("int 5(x) {}\nint ok() {}\n")
+    assert errors and errors[0][:2] == (1, 5)
+    assert [name for name, _, _ in parser.functions] == ["ok"]
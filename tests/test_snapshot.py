@@ -0,0 +1,133 @@
+# test_snapshot.py
+
+import os
+
+import pytest
+
+import snapshot
+from parseTree import Parser, STATE_NORMAL, tokenize, tokenize_line
+
+CODE = "\n".join([
+    "#include <stdio.h>",
+    "/* çok satırlı",
+    "   yorum */",
+    "int main() {",
+    "  char *s = \"a\\0b\";",
+    "  return 0x1F + .5f;",
+    "}",
+    "int 5(x) {}",
+])
+KEY = "0123456789abcdef"
+
+
+def _tokens(tokens):
+    return [(t.type, t.value, t.position, t.column) for t in tokens]
+
+
+def _line_caches(code):
+    state = STATE_NORMAL
+    for text in code.split("\n"):
+        tokens, end_state = tokenize_line(text, state)
+        yield tokens, state, end_state
+        state = end_state
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("C_HIGHLIGHTER_CACHE", str(tmp_path))
+    parser = Parser(tokenize(CODE))
+    errors = parser.parse()
+    assert errors
+    assert snapshot.write_snapshot(KEY, _line_caches(CODE), errors, parser.functions)
+    return snapshot.snapshot_path(KEY), errors, parser.functions
+
+
+def _patch(path, offset, data):
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+
+
+def test_round_trip(cache):
+    path, errors, outline = cache
+    assert os.path.dirname(path) == os.environ["C_HIGHLIGHTER_CACHE"]
+    snap = snapshot.load_snapshot(KEY)
+    assert snap is not None
+    try:
+        lines = CODE.split("\n")
+        assert snap.line_count == len(lines)
+        assert snap.errors == errors
+        assert snap.outline == outline
+        for index, (expected, state, end_state) in enumerate(_line_caches(CODE)):
+            tokens, restored_end = snap.line(index, lines[index], state)
+            assert _tokens(tokens) == _tokens(expected)
+            assert restored_end == end_state
+        # Başlangıç durumu tutmayan ya da anlık görüntüde olmayan satır lex’lenmeli
+        assert snap.line(2, lines[2], STATE_NORMAL) is None
+        assert snap.line(len(lines), "", STATE_NORMAL) is None
+    finally:
+        snap.close()
+
+
+def test_missing_snapshot(cache):
+    assert snapshot.load_snapshot("f" * 32) is None
+
+
+@pytest.mark.parametrize("offset, data", [
+    (0, b"XXXX"),                                             # magic
+    (6, bytes([1 - snapshot._BYTEORDER, 0])),                 # bayt sırası
+    (8, bytes(16)),                                           # parseTree parmak izi
+])
+def test_rejects_incompatible_header(cache, offset, data):
+    _patch(cache[0], offset, data)
+    assert snapshot.load_snapshot(KEY) is None
+
+
+def test_rejects_other_fingerprint(cache, monkeypatch):
+    monkeypatch.setattr(snapshot, "_fingerprint", b"\x01" * 16)
+    assert snapshot.load_snapshot(KEY) is None
+
+
+@pytest.mark.parametrize("size", [0, 10, snapshot._HEADER.size + 8, -1])
+def test_rejects_truncated(cache, size):
+    path = cache[0]
+    if size < 0:
+        size = os.path.getsize(path) - 1
+    os.truncate(path, size)
+    assert snapshot.load_snapshot(KEY) is None
+
+
+def test_restore_falls_back_when_line_count_differs(cache):
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    from CLanguageSyntaxHighlighter import CSyntaxHighlighter
+    from code_editor import CodeEditor
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    # Satır sayısı farklı; 6. satırın metni de değişti (anlık görüntüden okunsaydı
+    # token değerleri eski konumlardan yanlış kesilirdi)
+    text = CODE.replace("0x1F + .5f", "abcdefghijk") + "\nint added;"
+
+    def restore(code):
+        editor = CodeEditor()
+        highlighter = CSyntaxHighlighter(editor.document())
+        snap = snapshot.load_snapshot(KEY)
+        try:
+            restored = editor.restore(code, highlighter, snap)
+        finally:
+            snap.close()
+        app.processEvents()
+        blocks = []
+        block = editor.document().firstBlock()
+        while block.isValid():
+            blocks.append(_tokens(block.userData().tokens))
+            block = block.next()
+        editor.deleteLater()
+        return restored, blocks
+
+    restored, blocks = restore(CODE)
+    assert restored
+    assert blocks == [_tokens(tokens) for tokens, _, _ in _line_caches(CODE)]
+
+    restored, blocks = restore(text)
+    assert not restored
+    assert blocks == [_tokens(tokens) for tokens, _, _ in _line_caches(text)]
@@ -20,14 +20,17 @@ class Ui_MainWindow(object):
         self.centralwidget.setObjectName("centralwidget")
         self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
         self.gridLayout.setObjectName("gridLayout")
-        self.textEdit = QtWidgets.QTextEdit(self.centralwidget)
+        self.tabWidget = QtWidgets.QTabWidget(self.centralwidget)
         font = QtGui.QFont()
         font.setFamily("Rockwell")
         font.setPointSize(13)
-        self.textEdit.setFont(font)
-        self.textEdit.setStyleSheet("background-color: #dcdcdc;")
-        self.textEdit.setObjectName("textEdit")
-        self.gridLayout.addWidget(self.textEdit, 1, 0, 1, 1)
+        self.tabWidget.setFont(font)
+        self.tabWidget.setStyleSheet("background-color: #dcdcdc;")
+        self.tabWidget.setDocumentMode(True)
+        self.tabWidget.setTabsClosable(True)
+        self.tabWidget.setMovable(True)
+        self.tabWidget.setObjectName("tabWidget")
+        self.gridLayout.addWidget(self.tabWidget, 1, 0, 1, 1)
         self.lineEdit = QtWidgets.QLineEdit(self.centralwidget)
         font = QtGui.QFont()
         font.setPointSize(15)
@@ -37,9 +40,39 @@ class Ui_MainWindow(object):
         self.lineEdit.setObjectName("lineEdit")
         self.gridLayout.addWidget(self.lineEdit, 0, 0, 1, 1)
         MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1317, 26))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        MainWindow.setMenuBar(self.menubar)
         self.statusbar = QtWidgets.QStatusBar(MainWindow)
         self.statusbar.setObjectName("statusbar")
         MainWindow.setStatusBar(self.statusbar)
+        self.outlineDock = QtWidgets.QDockWidget(MainWindow)
+        self.outlineDock.setObjectName("outlineDock")
+        self.outlineDockContents = QtWidgets.QWidget()
+        self.outlineDockContents.setObjectName("outlineDockContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.outlineDockContents)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.outlineList = QtWidgets.QListWidget(self.outlineDockContents)
+        self.outlineList.setStyleSheet("background-color: #dcdcdc;")
+        self.outlineList.setObjectName("outlineList")
+        self.verticalLayout.addWidget(self.outlineList)
+        self.outlineDock.setWidget(self.outlineDockContents)
+        MainWindow.addDockWidget(QtCore.Qt.DockWidgetArea(1), self.outlineDock)
+        self.actionNew = QtWidgets.QAction(MainWindow)
+        self.actionNew.setObjectName("actionNew")
+        self.actionOpen = QtWidgets.QAction(MainWindow)
+        self.actionOpen.setObjectName("actionOpen")
+        self.actionClose = QtWidgets.QAction(MainWindow)
+        self.actionClose.setObjectName("actionClose")
+        self.menuFile.addAction(self.actionNew)
+        self.menuFile.addAction(self.actionOpen)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionClose)
+        self.menubar.addAction(self.menuFile.menuAction())
 
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -48,3 +81,11 @@ class Ui_MainWindow(object):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "Syntax Highlighter Program"))
         self.lineEdit.setText(_translate("MainWindow", "C LANGUAGE SYNTAX HİGHLİGHTER "))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.outlineDock.setWindowTitle(_translate("MainWindow", "Outline"))
+        self.actionNew.setText(_translate("MainWindow", "New"))
+        self.actionNew.setShortcut(_translate("MainWindow", "Ctrl+N"))
+        self.actionOpen.setText(_translate("MainWindow", "Open..."))
+        self.actionOpen.setShortcut(_translate("MainWindow", "Ctrl+O"))
+        self.actionClose.setText(_translate("MainWindow", "Close"))
+        self.actionClose.setShortcut(_translate("MainWindow", "Ctrl+W"))
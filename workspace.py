@@ -0,0 +1,420 @@
+# workspace.py
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from parseTree import tokenize, join_line_tokens, LineTokens, Parser
+
+# ----------------------------------------
+# ÇOK BELGELİ ÇALIŞMA ALANI (WORKSPACE)
+# ----------------------------------------
+#
+# Açık olan tüm belgeler tek bir sınırlı iş parçacığı havuzunu (WorkerPool) paylaşır.
+# Her belge için lex + parse işi havuza öncelikle gönderilir:
+#   - PRIORITY_VISIBLE:    Kullanıcının o an gördüğü sekme, her zaman önce çalışır.
+#   - PRIORITY_BACKGROUND: Arka plandaki sekmeler; aynı anda en fazla background_limit
+#                          kadar arka plan işi çalışır (kısıtlama/throttling).
+# Aynı belge için kuyruğa yeni bir iş geldiğinde, henüz başlamamış eski iş iptal edilir.
+#
+# Workspace, her belgenin son analiz sonucunu (hata listesi + outline) önbellekte tutar. Token’lar
+# belgenin sahibindedir (düzenleyicinin BlockData’ları, LSP sunucusunun satır önbellekleri);
+# sonuç yalnızca sayılarını taşır. Token önbelleğinin ve sonucun yaklaşık bellek maliyeti
+# hesaplanır; bütçe aşıldığında aktif olmayan belgelerin sonucu ve kaynağı (en uzun süredir
+# kullanılmayandan başlayarak) bırakılır ve on_evict ile sahibine token önbelleğini boşaltması
+# bildirilir. Sekme tekrar açıldığında önbellek talep üzerine yeniden kurulur ve belge yeniden
+# analiz edilir.
+
+PRIORITY_VISIBLE = 0
+PRIORITY_BACKGROUND = 1
+
+# Önbellek boyutu tahmini için yaklaşık bayt maliyetleri
+_TOKEN_BYTES = 160       # Token nesnesi + __slots__ alanları + liste girdisi
+_ERROR_BYTES = 200       # (satır, kolon, mesaj) üçlüsü
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024      # Tüm belgeler için toplam bütçe
+DEFAULT_DOCUMENT_BUDGET = 8 * 1024 * 1024     # Arka plandaki tek bir belge için bütçe
+
+
+class Job:
+    """
+    Havuza gönderilen tek bir iş:
+    - key:       İşin ait olduğu belge (aynı key için yalnızca en yeni iş çalışır).
+    - priority:  PRIORITY_VISIBLE veya PRIORITY_BACKGROUND.
+    - fn:        Çalıştırılacak fonksiyon (argümansız).
+    - callback:  fn bittiğinde callback(job, sonuç) olarak çağrılır (işçi thread’inde).
+    """
+    __slots__ = ("key", "priority", "fn", "callback", "cancelled", "started")
+
+    def __init__(self, key, priority: int, fn: Callable, callback: Optional[Callable]):
+        self.key = key
+        self.priority = priority
+        self.fn = fn
+        self.callback = callback
+        self.cancelled = False
+        self.started = False
+
+    def __repr__(self):
+        return f"Job({self.key!r}, priority={self.priority})"
+
+
+class WorkerPool:
+    """
+    Öncelik sıralı, sınırlı sayıda işçi thread’i olan iş havuzu.
+    Kuyruk bir heap’tir: (öncelik, sıra, iş). Bir işin önceliği değiştiğinde heap’e yeni
+    bir girdi eklenir; eski girdi çekildiğinde önceliği tutmadığı için atlanır.
+    """
+
+    def __init__(self, workers: int = 2, background_limit: int = 1):
+        self._heap: List[Tuple[int, int, Job]] = []
+        self._pending: Dict[object, Job] = {}     # key → henüz başlamamış iş
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._background_limit = max(1, background_limit)
+        self._running_background = 0
+        self._closed = False
+        self._threads = []
+        for i in range(max(1, workers)):
+            t = threading.Thread(target=self._run, name=f"lexer-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, key, priority: int, fn: Callable, callback: Optional[Callable] = None) -> Job:
+        """
+        Yeni bir iş kuyruğa ekler. Aynı key için bekleyen bir iş varsa iptal edilir
+        (art arda gelen düzenlemeler tek bir analizde birleşir).
+        """
+        job = Job(key, priority, fn, callback)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("WorkerPool is shut down")
+            old = self._pending.get(key)
+            if old is not None:
+                old.cancelled = True
+            self._pending[key] = job
+            heapq.heappush(self._heap, (priority, next(self._counter), job))
+            self._cond.notify()
+        return job
+
+    def reprioritize(self, key, priority: int):
+        """
+        Bekleyen işin önceliğini değiştirir (ör. sekme görünür olduğunda).
+        """
+        with self._cond:
+            job = self._pending.get(key)
+            if job is None or job.priority == priority:
+                return
+            job.priority = priority
+            heapq.heappush(self._heap, (priority, next(self._counter), job))
+            self._cond.notify_all()
+
+    def cancel(self, key):
+        """
+        Belgeye ait bekleyen işi iptal eder (çalışmakta olan iş tamamlanır ama sonucu
+        Workspace tarafından sürüm kontrolüyle atılır).
+        """
+        with self._cond:
+            job = self._pending.pop(key, None)
+            if job is not None:
+                job.cancelled = True
+
+    def shutdown(self, wait: bool = True):
+        """
+        Havuzu kapatır; bekleyen işler çalıştırılmaz.
+        """
+        with self._cond:
+            self._closed = True
+            for job in self._pending.values():
+                job.cancelled = True
+            self._pending.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+        if wait:
+            for t in self._threads:
+                t.join()
+
+    def _next_job(self) -> Optional[Job]:
+        """
+        Heap’ten çalıştırılabilir ilk işi çeker. İptal edilmiş veya önceliği değişmiş
+        girdiler atlanır. Heap’in tepesinde arka plan işi varsa ve arka plan sınırı doluysa,
+        geri kalan tüm işler de arka plan işidir; bu durumda bekleriz.
+        """
+        while self._heap:
+            priority, _, job = self._heap[0]
+            if job.cancelled or job.started or priority != job.priority:
+                heapq.heappop(self._heap)
+                continue
+            if priority >= PRIORITY_BACKGROUND and self._running_background >= self._background_limit:
+                return None
+            heapq.heappop(self._heap)
+            return job
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+                job.started = True
+                if self._pending.get(job.key) is job:
+                    del self._pending[job.key]
+                background = job.priority >= PRIORITY_BACKGROUND
+                if background:
+                    self._running_background += 1
+
+            try:
+                result = job.fn()
+            except Exception as exc:   # İşçi thread’i hiçbir hatada ölmemeli
+                result = exc
+            finally:
+                if background:
+                    with self._cond:
+                        self._running_background -= 1
+                        self._cond.notify_all()
+
+            if job.callback is not None and not job.cancelled:
+                job.callback(job, result)
+
+
+class AnalysisResult:
+    """
+    Bir belgenin tek bir sürümü için lex + parse sonucu:
+    - version:     Analiz edilen belge sürümü.
+    - token_count: Belgenin token sayısı. Token listesi sonuçta tutulmaz; belgenin sahibinin
+                   önbelleğindedir ve bütçe aşılınca oradan bırakılır (bkz. Workspace.on_evict).
+    - errors:      Parser.parse() çıktısı, (satır, kolon, mesaj) listesi.
+    - outline:     Üst seviyedeki fonksiyonlar, Parser.functions: (isim, satır, kolon) listesi.
+    - size:        Önbellek atıldığında serbest kalacak yaklaşık bellek (bayt): belgenin token
+                   önbelleği ve hata listesi.
+    - failed:      Analiz bir istisnayla bitti; errors yalnızca bu hatayı içerir (bkz. failed_result).
+    """
+    __slots__ = ("version", "token_count", "errors", "outline", "size", "failed")
+
+    def __init__(self, version: int, token_count: int, errors: List[Tuple[int, int, str]],
+                 outline: Optional[List[Tuple[str, int, int]]] = None, failed: bool = False):
+        self.version = version
+        self.token_count = token_count
+        self.errors = errors
+        self.outline = outline if outline is not None else []
+        self.size = token_count * _TOKEN_BYTES + len(errors) * _ERROR_BYTES
+        self.failed = failed
+
+    def __repr__(self):
+        return f"AnalysisResult(version={self.version}, tokens={self.token_count}, errors={len(self.errors)})"
+
+
+def analyze(source: Union[str, Iterable[LineTokens]], version: int = 0) -> AnalysisResult:
+    """
+    Tek bir belgeyi analiz eder. source bir metinse önce tokenize edilir; satır satır
+    lex’lenmiş bir belgeyse (ör. LSP sunucusunun satır önbellekleri) satırların token’ları
+    burada, işçi thread’inde join_line_tokens ile mutlak konumlu listeye birleştirilir.
+    """
+    tokens = tokenize(source) if isinstance(source, str) else join_line_tokens(source)
+    parser = Parser(tokens)
+    errors = parser.parse()
+    return AnalysisResult(version, len(tokens), errors, parser.functions)
+
+
+def failed_result(version: int, exc: Exception) -> AnalysisResult:
+    """
+    analyze() bir istisnayla bittiğinde (ör. çok derin iç içe ifadelerde RecursionError) belgenin
+    sonucu: istisna 1. satıra düşen tek bir hata olarak raporlanır. Normal bir sonuç gibi
+    on_result ile bildirildiği için GUI ve LSP bunu gösterebilir; önbellekte tutulduğu için
+    aynı sürüm tekrar tekrar analiz edilmez.
+    """
+    return AnalysisResult(version, 0, [(1, 1, f"Analysis failed: {type(exc).__name__}: {exc}")],
+                          failed=True)
+
+
+class Document:
+    """
+    Workspace içinde açık olan bir belgenin durumu.
+    """
+    __slots__ = ("doc_id", "source", "version", "result", "pending", "last_used")
+
+    def __init__(self, doc_id, source):
+        self.doc_id = doc_id
+        # Belge metni veya satırları (bkz. analyze); tekrar dolaşılabilir. Önbellek atılınca None
+        # olur ve sahibi update() ile yeniden verir (bkz. needs_source)
+        self.source = source
+        self.version = 0
+        self.result: Optional[AnalysisResult] = None
+        self.pending = False     # Bu belge için havuzda bekleyen/çalışan bir iş var mı
+        self.last_used = time.monotonic()
+
+
+class Workspace:
+    """
+    Açık belgeleri, paylaşılan WorkerPool’u ve sonuç önbelleğini yönetir.
+    - on_result(doc_id, result): Yeni bir analiz sonucu hazır olduğunda çağrılır
+      (işçi thread’inden; GUI tarafı bunu kendi thread’ine taşımalıdır). Analiz hata
+      verdiyse result.failed True’dur (bkz. failed_result).
+    - on_evict(doc_id): Bir belgenin sonucu ve kaynağı bütçe nedeniyle bırakıldığında çağrılır
+      (işçi thread’inden de çağrılabilir); sahibi belgenin token önbelleğini boşaltmalıdır.
+    """
+
+    def __init__(self, pool: Optional[WorkerPool] = None,
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 document_budget: int = DEFAULT_DOCUMENT_BUDGET,
+                 on_result: Optional[Callable] = None,
+                 on_evict: Optional[Callable] = None):
+        self.pool = pool if pool is not None else WorkerPool()
+        self.memory_budget = memory_budget
+        self.document_budget = document_budget
+        self.on_result = on_result
+        self.on_evict = on_evict
+        self.documents: Dict[object, Document] = {}
+        self.active = None
+        self._lock = threading.RLock()
+
+    # -- Belge yaşam döngüsü --------------------------------------------
+
+    def open(self, doc_id, source: Optional[Union[str, Iterable[LineTokens]]] = "",
+             result: Optional[AnalysisResult] = None):
+        """
+        Yeni bir belge açar ve ilk analizini kuyruğa ekler. result verilirse (ör. diskteki
+        anlık görüntüden) analiz yapılmaz; bu durumda source None olabilir, önbellek atılınca
+        sahibi kaynağı update() ile verir.
+        """
+        with self._lock:
+            doc = Document(doc_id, source)
+            self.documents[doc_id] = doc
+            if result is not None:
+                doc.result = result
+                self._enforce_budget()
+            else:
+                self._schedule(doc)
+
+    def update(self, doc_id, source: Union[str, Iterable[LineTokens]]):
+        """
+        Belgenin içeriğini (metin veya satırları) günceller; eski sürümün sonucu
+        geçersiz sayılır.
+        """
+        with self._lock:
+            doc = self.documents[doc_id]
+            doc.source = source
+            doc.version += 1
+            doc.last_used = time.monotonic()
+            self._schedule(doc)
+
+    def close(self, doc_id):
+        with self._lock:
+            self.documents.pop(doc_id, None)
+            self.pool.cancel(doc_id)
+            if self.active == doc_id:
+                self.active = None
+
+    def activate(self, doc_id):
+        """
+        Görünür sekmeyi değiştirir. Yeni aktif belgenin bekleyen işi öne alınır, önceki
+        aktif belge arka plana düşer ve gerekirse önbelleği atılır.
+        """
+        with self._lock:
+            previous = self.active
+            self.active = doc_id
+            if previous is not None and previous != doc_id:
+                self.pool.reprioritize(previous, PRIORITY_BACKGROUND)
+            doc = self.documents.get(doc_id)
+            if doc is not None:
+                doc.last_used = time.monotonic()
+                self.pool.reprioritize(doc_id, PRIORITY_VISIBLE)
+            self._enforce_budget()
+
+    def result(self, doc_id) -> Optional[AnalysisResult]:
+        """
+        Belgenin güncel analiz sonucunu döner. Sonuç yoksa None döner ve kaynağı varsa
+        analizi yeniden kuyruğa ekler; sonuç hazır olunca on_result ile bildirilir.
+        """
+        with self._lock:
+            doc = self.documents.get(doc_id)
+            if doc is None:
+                return None
+            doc.last_used = time.monotonic()
+            if doc.result is not None and doc.result.version == doc.version:
+                return doc.result
+            if not doc.pending and doc.source is not None:
+                self._schedule(doc)
+            return None
+
+    def needs_source(self, doc_id) -> bool:
+        """
+        Belgenin önbelleği atılmış ve yeniden analiz için kaynağı yok mu? True ise sahibi
+        token önbelleğini yeniden kurup update() ile vermelidir.
+        """
+        with self._lock:
+            doc = self.documents.get(doc_id)
+            return doc is not None and doc.source is None and doc.result is None and not doc.pending
+
+    def memory_usage(self) -> int:
+        """
+        Tüm belgelerin önbellekteki yaklaşık toplam boyutu (bayt).
+        """
+        with self._lock:
+            return sum(d.result.size for d in self.documents.values() if d.result is not None)
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+    # -- İç işleyiş -----------------------------------------------------
+
+    def _schedule(self, doc: Document):
+        priority = PRIORITY_VISIBLE if doc.doc_id == self.active else PRIORITY_BACKGROUND
+        version = doc.version
+        source = doc.source
+        doc.pending = True
+        self.pool.submit(doc.doc_id, priority,
+                         lambda: analyze(source, version),
+                         lambda job, result: self._on_job_done(job, result, version))
+
+    def _on_job_done(self, job: Job, result, version: int):
+        if isinstance(result, Exception):
+            result = failed_result(version, result)
+        with self._lock:
+            doc = self.documents.get(job.key)
+            if doc is None:
+                return
+            if result.version != doc.version:
+                # Analiz sürerken belge değişti; yeni iş zaten kuyrukta
+                return
+            doc.pending = False
+            doc.result = result
+            self._enforce_budget()
+        if self.on_result is not None:
+            self.on_result(job.key, result)
+
+    def _evict(self, doc: Document):
+        # Kaynak (ör. düzenleyicinin satır listesi) token listelerine referans tutar; o da
+        # bırakılmazsa sahibinin boşalttığı token’lar bellekte kalır
+        doc.result = None
+        doc.source = None
+        if self.on_evict is not None:
+            self.on_evict(doc.doc_id)
+
+    def _enforce_budget(self):
+        """
+        1) Arka plandaki, tek başına document_budget’ı aşan belgelerin önbelleği atılır.
+        2) Toplam boyut hâlâ memory_budget’ın üzerindeyse, aktif olmayan belgeler en uzun
+           süredir kullanılmayandan başlanarak boşaltılır.
+        """
+        inactive = [d for d in self.documents.values()
+                    if d.doc_id != self.active and d.result is not None]
+        for doc in inactive:
+            if doc.result.size > self.document_budget:
+                self._evict(doc)
+
+        total = sum(d.result.size for d in self.documents.values() if d.result is not None)
+        if total <= self.memory_budget:
+            return
+        for doc in sorted(inactive, key=lambda d: d.last_used):
+            if doc.result is None:
+                continue
+            total -= doc.result.size
+            self._evict(doc)
+            if total <= self.memory_budget:
+                break